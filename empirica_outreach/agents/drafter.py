@@ -2,7 +2,6 @@
 
 import uuid
 from typing import List, Optional
-from datetime import datetime
 
 from empirica.core.agents import spawn_epistemic_agent, EpistemicAgentConfig
 from empirica_outreach.models import (
@@ -19,9 +18,16 @@ class OutreachDrafter:
     Outputs drafts with confidence scoring and epistemic markers.
     """
     
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, db: Optional[OutreachDatabase] = None):
+        """
+        Args:
+            session_id: Empirica session ID
+            db: Shared database to use; if omitted, the agent opens (and
+                on close() closes) its own
+        """
         self.session_id = session_id
-        self.db = OutreachDatabase()
+        self._owns_db = db is None
+        self.db = OutreachDatabase() if db is None else db
     
     def draft_response(self, opportunity: Opportunity, 
                       channel: ChannelProfile,
@@ -66,8 +72,7 @@ Audience: technical_level={channel.audience.technical_level:.2f}
         drafts = self._create_drafts(opportunity, channel, variations)
         
         # Store drafts
-        for draft in drafts:
-            self.db.add_draft(draft)
+        self.db.add_drafts(drafts)
         
         return drafts
     
@@ -180,24 +185,15 @@ This connects to epistemic self-awareness - being explicit about what you know v
     
     def approve_draft(self, draft_id: str, feedback: Optional[str] = None):
         """Approve a draft for posting"""
-        draft = self.db.get_draft(draft_id)
-        if draft:
-            draft.status = DraftStatus.APPROVED
-            draft.human_feedback = feedback
-            draft.reviewed_at = datetime.utcnow()
-            self.db.update_draft(draft)
+        self.db.update_draft_status(draft_id, DraftStatus.APPROVED.value, feedback)
     
     def reject_draft(self, draft_id: str, feedback: str):
         """Reject a draft"""
-        draft = self.db.get_draft(draft_id)
-        if draft:
-            draft.status = DraftStatus.REJECTED
-            draft.human_feedback = feedback
-            draft.reviewed_at = datetime.utcnow()
-            self.db.update_draft(draft)
+        self.db.update_draft_status(draft_id, DraftStatus.REJECTED.value, feedback)
     
     def close(self):
-        self.db.close()
+        if self._owns_db:
+            self.db.close()
     
     def __enter__(self):
         return self
@@ -1,7 +1,9 @@
 """Scout agent - monitors channels for opportunities"""
 
+import re
 import uuid
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 from empirica.core.agents import spawn_epistemic_agent, EpistemicAgentConfig
@@ -11,6 +13,64 @@ from empirica_outreach.models import (
 from empirica_outreach.storage import OutreachDatabase
 
 
+# Detection keywords, built once at import
+_PAIN_KW = ('context loss', 'losing context', 'forgets',
+            'epistemic', 'uncertainty', "don't know")
+_AI_KW = ('claude', 'chatgpt', 'llm', 'ai agent')
+
+# Keyword categories, OR-ed into a per-post bitmask
+_PAIN_POINT = 1
+_AI_MENTION = 2
+
+_KEYWORD_CATEGORIES = {
+    **dict.fromkeys(_PAIN_KW, _PAIN_POINT),
+    **dict.fromkeys(_AI_KW, _AI_MENTION),
+}
+_ALL_CATEGORIES = _PAIN_POINT | _AI_MENTION
+_MIN_KEYWORD_LEN = min(len(kw) for kw in _KEYWORD_CATEGORIES)
+
+# Reddit placeholders for removed/deleted post bodies
+_REMOVED_CONTENT = frozenset(('[removed]', '[deleted]'))
+
+# Single alternation over every keyword: one C-level pass per post
+# instead of a Python `in` scan per keyword
+_KEYWORD_RE = re.compile('|'.join(re.escape(kw) for kw in _KEYWORD_CATEGORIES))
+
+
+@lru_cache(maxsize=4096)
+def _score_post(full_text: str) -> Tuple[float, bool, bool, bool]:
+    """
+    Score lowercased post text.
+    
+    Pure function of the text, so re-polled posts are served from cache.
+    
+    Returns:
+        (relevance, has_pain, is_question, mentions_ai)
+    """
+    # Check for pain points and AI tool mentions in one scan
+    mask = 0
+    for match in _KEYWORD_RE.finditer(full_text):
+        mask |= _KEYWORD_CATEGORIES[match.group()]
+        if mask == _ALL_CATEGORIES:
+            break
+    has_pain = bool(mask & _PAIN_POINT)
+    mentions_ai = bool(mask & _AI_MENTION)
+    
+    # Check for questions (more than 5 words; maxsplit stops after the 6th)
+    is_question = '?' in full_text and len(full_text.split(None, 5)) > 5
+    
+    # Calculate relevance
+    relevance = 0.0
+    if has_pain:
+        relevance += 0.4
+    if is_question:
+        relevance += 0.3
+    if mentions_ai:
+        relevance += 0.3
+    
+    return relevance, has_pain, is_question, mentions_ai
+
+
 class OutreachScout:
     """
     Monitors channels for engagement opportunities.
@@ -19,9 +79,16 @@ class OutreachScout:
     Outputs opportunities with epistemic assessment.
     """
     
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, db: Optional[OutreachDatabase] = None):
+        """
+        Args:
+            session_id: Empirica session ID
+            db: Shared database to use; if omitted, the agent opens (and
+                on close() closes) its own
+        """
         self.session_id = session_id
-        self.db = OutreachDatabase()
+        self._owns_db = db is None
+        self.db = OutreachDatabase() if db is None else db
     
     def scan_channel(self, channel: ChannelProfile, posts: List[Dict]) -> List[Opportunity]:
         """
@@ -61,8 +128,7 @@ Pain points: {', '.join(channel.audience.pain_points)}
         opportunities = self._parse_opportunities(channel, posts)
         
         # Store opportunities
-        for opp in opportunities:
-            self.db.add_opportunity(opp)
+        self.db.add_opportunities(opportunities)
         
         return opportunities
     
@@ -97,70 +163,62 @@ Return opportunities as structured output.
         
         for post in posts:
             # Simple keyword matching (placeholder for agent logic)
-            content = post.get('content', '').lower()
-            title = post.get('title', '').lower()
-            full_text = f"{title} {content}"
-            
-            # Check for pain points
-            pain_keywords = ['context loss', 'losing context', 'forgets', 
-                           'epistemic', 'uncertainty', 'don\'t know']
-            has_pain = any(kw in full_text for kw in pain_keywords)
+            content = post.get('content', '')
+            if content in _REMOVED_CONTENT:
+                content = ''
+            full_text = f"{post.get('title', '')} {content}".lower()
             
-            # Check for questions
-            is_question = '?' in full_text and len(full_text.split()) > 5
+            # Too short to contain any keyword
+            if len(full_text) < _MIN_KEYWORD_LEN:
+                continue
             
-            # Check for AI tool mentions
-            mentions_ai = any(term in full_text for term in 
-                            ['claude', 'chatgpt', 'llm', 'ai agent'])
-            
-            # Calculate relevance
-            relevance = 0.0
-            if has_pain:
-                relevance += 0.4
-            if is_question:
-                relevance += 0.3
-            if mentions_ai:
-                relevance += 0.3
-            
-            if relevance >= 0.5:
-                # Create opportunity
-                opp_type = (OpportunityType.PAIN_POINT_EXPRESSED if has_pain 
-                           else OpportunityType.QUESTION_WE_CAN_ANSWER if is_question
-                           else OpportunityType.RELEVANT_DISCUSSION)
-                
-                opportunity = Opportunity(
-                    id=str(uuid.uuid4()),
-                    channel_id=channel.id,
-                    type=opp_type,
-                    source_url=post.get('url', ''),
-                    source_content=content[:500],  # Truncate
-                    source_author=post.get('author', 'unknown'),
-                    source_timestamp=post.get('timestamp', datetime.utcnow()),
-                    relevance_score=relevance,
-                    engagement_potential=relevance * 0.8,  # Simplified
-                    urgency=0.5 if is_question else 0.3,
-                    epistemic_assessment={
-                        "know": channel.epistemic_state.get('know', 0.6),
-                        "signal": 0.85,  # Scout's signal detection strength
-                        "uncertainty": 0.4  # Scout's uncertainty
-                    },
-                    confidence_to_engage=relevance if relevance > 0.7 else 0.6,
-                    recommended_action=(ActionType.ENGAGE if relevance > 0.7 
-                                      else ActionType.MONITOR),
-                    reasoning=f"Detected {opp_type.value} with relevance {relevance:.2f}",
-                    status=OpportunityStatus.NEW
+            scores = _score_post(full_text)
+            if scores[0] >= 0.5:
+                opportunities.append(
+                    self._build_opportunity(channel, post, content, scores)
                 )
-                
-                opportunities.append(opportunity)
         
         return opportunities
     
+    def _build_opportunity(self, channel: ChannelProfile, post: Dict, content: str,
+                           scores: Tuple[float, bool, bool, bool]) -> Opportunity:
+        """Create an opportunity from a post and its scores"""
+        relevance, has_pain, is_question, mentions_ai = scores
+        
+        opp_type = (OpportunityType.PAIN_POINT_EXPRESSED if has_pain 
+                   else OpportunityType.QUESTION_WE_CAN_ANSWER if is_question
+                   else OpportunityType.RELEVANT_DISCUSSION)
+        
+        return Opportunity(
+            id=uuid.uuid4().hex,
+            channel_id=channel.id,
+            type=opp_type,
+            source_url=post.get('url', ''),
+            source_content=content[:500],  # Truncate
+            source_author=post.get('author', 'unknown'),
+            source_timestamp=post.get('timestamp', datetime.utcnow()),
+            relevance_score=relevance,
+            engagement_potential=relevance * 0.8,  # Simplified
+            urgency=0.5 if is_question else 0.3,
+            epistemic_assessment={
+                "know": channel.epistemic_state.get('know', 0.6),
+                "signal": 0.85,  # Scout's signal detection strength
+                "uncertainty": 0.4  # Scout's uncertainty
+            },
+            confidence_to_engage=relevance if relevance > 0.7 else 0.6,
+            recommended_action=(ActionType.ENGAGE if relevance > 0.7 
+                              else ActionType.MONITOR),
+            reasoning=f"Detected {opp_type.value} with relevance {relevance:.2f}",
+            status=OpportunityStatus.NEW
+        )
+    
     def get_pending_opportunities(self, channel_id: str = None) -> List[Opportunity]:
         """Get opportunities pending review"""
         return self.db.list_opportunities(channel_id=channel_id, status="new")
     
     def close(self):
-        self.db.close()
+        if self._owns_db:
+            self.db.close()
     
     def __enter__(self):
         return self
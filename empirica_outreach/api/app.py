@@ -1,10 +1,39 @@
 """Flask application for Empirica Outreach API"""
 
 import logging
-from flask import Flask, jsonify
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from flask import Flask, current_app, jsonify, g
+from flask.json.provider import DefaultJSONProvider
+
+from empirica_outreach.storage import OutreachDatabase
 
 logger = logging.getLogger(__name__)
 
+def get_db() -> OutreachDatabase:
+    """Get the database for the current request"""
+    if 'db' not in g:
+        g.db = current_app.extensions['outreach_db']
+    return g.db
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes responses and decodes request bodies with orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default),
+                            option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 def create_app() -> Flask:
     """Create and configure Flask application"""
@@ -14,6 +43,17 @@ def create_app() -> Flask:
         static_folder='./static',
         template_folder='./templates'
     )
+    app.json = OrjsonProvider(app)
+    
+    # Shared by all worker threads; it opens one connection per thread
+    app.extensions['outreach_db'] = OutreachDatabase()
+    
+    # Background Scout runs, keyed by job ID in submission order
+    app.extensions['scout_pool'] = ThreadPoolExecutor(
+        max_workers=4, thread_name_prefix='scout'
+    )
+    app.extensions['scout_jobs'] = OrderedDict()
+    app.extensions['scout_jobs_lock'] = threading.Lock()
     
     # Enable CORS
     @app.after_request
@@ -23,6 +63,16 @@ def create_app() -> Flask:
         response.headers['Access-Control-Allow-Headers'] = '*'
         return response
     
+    # Don't let a transaction a request left open (e.g. a statement that
+    # raised before commit) carry over to the next request on this thread.
+    # Checked unconditionally: the app-wide error handler means teardown
+    # always sees error=None.
+    @app.teardown_appcontext
+    def rollback_open_transaction(error):
+        db = g.pop('db', None)
+        if db is not None and db.conn.in_transaction:
+            db.conn.rollback()
+    
     # Health check
     @app.route("/health", methods=["GET"])
     def health_check():
@@ -49,4 +99,4 @@ def create_app() -> Flask:
 
 if __name__ == "__main__":
     app = create_app()
-    app.run(host="0.0.0.0", port=8001, debug=True)
+    app.run(host="0.0.0.0", port=8001, threaded=True, debug=False)
@@ -1,36 +1,123 @@
 """API routes for outreach dashboard"""
 
 from datetime import datetime
-from flask import Blueprint, jsonify, request, render_template
-from empirica_outreach.storage import OutreachDatabase
+import orjson
+from flask import (
+    Blueprint, Response, current_app, jsonify, request,
+    send_from_directory, stream_with_context
+)
+from empirica_outreach.api.app import get_db
 from empirica_outreach.agents import OutreachScout, OutreachDrafter
 from empirica_outreach.integrations import RedditClient, RedditMonitor
+from empirica_outreach.storage import OutreachDatabase
 from empirica_outreach.models import (
     Platform, ChannelProfile, AudienceProfile,
-    ChannelStrategy, ChannelConstraints, EngagementMetrics
+    ChannelStrategy, ChannelConstraints, EngagementMetrics, DraftStatus
 )
+import os
+import re
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Set, Tuple
 
 bp = Blueprint('outreach', __name__)
 
+_PLATFORM_MAP = {p.value: p for p in Platform}
+
+# Epistemic scoring vocabulary for /score, matched in a single pass
+_SCORE_KEYWORDS = (
+    'empirica', 'epistemic', 'uncertainty', 'confidence',
+    'calibration', 'alignment', 'grounding', 'self-aware',
+    'context', 'know', 'guess', 'trust'
+)
+_TECHNICAL_TERMS = ('implement', 'algorithm', 'architecture', 'api', 'system')
+_PAIN_POINT_TERMS = ('problem', 'issue', 'challenge', 'difficult', 'struggle')
+
+
+def _alternation(terms) -> str:
+    return '|'.join(re.escape(term) for term in terms)
+
+
+_SCORE_RE = re.compile(
+    f"(?P<kw>{_alternation(_SCORE_KEYWORDS)})"
+    f"|(?P<tech>{_alternation(_TECHNICAL_TERMS)})"
+    f"|(?P<pain>{_alternation(_PAIN_POINT_TERMS)})"
+    r"|(?P<q>\?)",
+    re.IGNORECASE
+)
+_INDICATOR_COUNT = 3
+
+
+def _scan_score_terms(text: str) -> Tuple[int, Set[str]]:
+    """
+    Scan text for scoring vocabulary in one pass.
+    
+    Stops as soon as every keyword and indicator has been seen.
+    
+    Returns:
+        (distinct keyword count, set of indicator groups: 'q', 'tech', 'pain')
+    """
+    keywords_found = set()
+    indicators = set()
+    
+    for match in _SCORE_RE.finditer(text):
+        category = match.lastgroup
+        if category == 'kw':
+            keywords_found.add(match.group().lower())
+        else:
+            indicators.add(category)
+        
+        if (len(keywords_found) == len(_SCORE_KEYWORDS)
+                and len(indicators) == _INDICATOR_COUNT):
+            break
+    
+    return len(keywords_found), indicators
+
+
+def _stream_list(key: str, items) -> Response:
+    """
+    Stream {"ok": true, <key>: [...], "count": n} one item at a time.
+    
+    Items are stored row dicts (already in to_dict() shape) pulled from
+    the database cursor as the body is written, so the full result set
+    is never materialized and rows are never decoded into models.
+    
+    The first item is fetched before the response starts, so the query
+    runs (and can fail into the JSON 500 handler) before a 200 is sent.
+    """
+    items = iter(items)
+    first = next(items, None)
+    
+    def generate():
+        yield f'{{"ok":true,"{key}":['.encode()
+        if first is None:
+            yield b'],"count":0}'
+            return
+        yield orjson.dumps(first)
+        count = 1
+        for item in items:
+            yield b','
+            yield orjson.dumps(item)
+            count += 1
+        yield f'],"count":{count}}}'.encode()
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
 
 @bp.route('/', methods=['GET'])
 def dashboard():
-    """Serve dashboard HTML"""
-    return render_template('dashboard.html')
+    """Serve dashboard HTML (static; revalidated via ETag/Last-Modified)"""
+    template_dir = os.path.join(current_app.root_path, current_app.template_folder)
+    return send_from_directory(template_dir, 'dashboard.html', max_age=300)
 
 
 @bp.route('/channels', methods=['GET'])
 def list_channels():
     """List all channels"""
-    db = OutreachDatabase()
-    channels = db.list_channels()
-    db.close()
-    
-    return jsonify({
-        "ok": True,
-        "channels": [c.to_dict() for c in channels]
-    })
+    db = get_db()
+    return _stream_list("channels", db.iter_channel_rows())
 
 
 @bp.route('/opportunities', methods=['GET'])
@@ -43,32 +130,26 @@ def list_opportunities():
         status: Filter by status (new, reviewed, engaged, skipped)
         limit: Max results (default 50)
     """
-    db = OutreachDatabase()
+    db = get_db()
     
     channel_id = request.args.get('channel_id')
     status = request.args.get('status')
     limit = int(request.args.get('limit', 50))
     
-    opportunities = db.list_opportunities(
+    opportunities = db.iter_opportunity_rows(
         channel_id=channel_id,
         status=status,
         limit=limit
     )
-    db.close()
     
-    return jsonify({
-        "ok": True,
-        "opportunities": [o.to_dict() for o in opportunities],
-        "count": len(opportunities)
-    })
+    return _stream_list("opportunities", opportunities)
 
 
 @bp.route('/opportunities/<opportunity_id>', methods=['GET'])
 def get_opportunity(opportunity_id):
     """Get single opportunity"""
-    db = OutreachDatabase()
+    db = get_db()
     opportunity = db.get_opportunity(opportunity_id)
-    db.close()
     
     if not opportunity:
         return jsonify({
@@ -93,32 +174,26 @@ def list_drafts():
         status: Filter by status (pending_review, approved, rejected, posted)
         limit: Max results (default 50)
     """
-    db = OutreachDatabase()
+    db = get_db()
     
     opportunity_id = request.args.get('opportunity_id')
     status = request.args.get('status', 'pending_review')
     limit = int(request.args.get('limit', 50))
     
-    drafts = db.list_drafts(
+    drafts = db.iter_draft_rows(
         opportunity_id=opportunity_id,
         status=status,
         limit=limit
     )
-    db.close()
     
-    return jsonify({
-        "ok": True,
-        "drafts": [d.to_dict() for d in drafts],
-        "count": len(drafts)
-    })
+    return _stream_list("drafts", drafts)
 
 
 @bp.route('/drafts/<draft_id>', methods=['GET'])
 def get_draft(draft_id):
     """Get single draft"""
-    db = OutreachDatabase()
+    db = get_db()
     draft = db.get_draft(draft_id)
-    db.close()
     
     if not draft:
         return jsonify({
@@ -146,23 +221,14 @@ def approve_draft(draft_id):
     session_id = data.get('session_id', f"approve-{uuid.uuid4()}")
     feedback = data.get('feedback', '')
     
-    db = OutreachDatabase()
-    draft = db.get_draft(draft_id)
-    
-    if not draft:
-        db.close()
+    db = get_db()
+    if not db.update_draft_status(draft_id, DraftStatus.APPROVED.value, feedback):
         return jsonify({
             "ok": False,
             "error": "not_found",
             "message": "Draft not found"
         }), 404
     
-    # Update status
-    draft.status = "approved"
-    draft.human_review_feedback = feedback
-    db.update_draft(draft)
-    db.close()
-    
     return jsonify({
         "ok": True,
         "draft_id": draft_id,
@@ -184,23 +250,14 @@ def reject_draft(draft_id):
     session_id = data.get('session_id', f"reject-{uuid.uuid4()}")
     feedback = data.get('feedback', 'Rejected by human')
     
-    db = OutreachDatabase()
-    draft = db.get_draft(draft_id)
-    
-    if not draft:
-        db.close()
+    db = get_db()
+    if not db.update_draft_status(draft_id, DraftStatus.REJECTED.value, feedback):
         return jsonify({
             "ok": False,
             "error": "not_found",
             "message": "Draft not found"
         }), 404
     
-    # Update status
-    draft.status = "rejected"
-    draft.human_review_feedback = feedback
-    db.update_draft(draft)
-    db.close()
-    
     return jsonify({
         "ok": True,
         "draft_id": draft_id,
@@ -229,11 +286,10 @@ def edit_draft(draft_id):
             "message": "Missing 'body' field"
         }), 400
     
-    db = OutreachDatabase()
+    db = get_db()
     draft = db.get_draft(draft_id)
     
     if not draft:
-        db.close()
         return jsonify({
             "ok": False,
             "error": "not_found",
@@ -241,37 +297,85 @@ def edit_draft(draft_id):
         }), 404
     
     # Track edit
-    if not draft.edit_history:
-        draft.edit_history = []
-    
-    draft.edit_history.append({
-        "version": len(draft.edit_history) + 1,
-        "previous_body": draft.body,
-        "timestamp": str(uuid.uuid4())  # Simplified
-    })
+    edit = draft.add_edit(
+        editor="human",
+        change_type="content",
+        before=draft.body,
+        after=new_body
+    )
     
     draft.body = new_body
-    draft.human_edited = True
-    db.update_draft(draft)
-    db.close()
+    db.update_draft_body(draft_id, new_body, edit)
     
     return jsonify({
         "ok": True,
         "draft_id": draft_id,
         "message": "Draft updated",
-        "edit_count": len(draft.edit_history)
+        "edit_count": len(draft.edits_made)
     })
 
 
+# Finished Scout jobs hold their full results, so they are kept only long
+# enough to be polled, and only the newest few hundred at that
+_SCOUT_JOB_TTL = 3600  # seconds after finishing
+_SCOUT_JOB_LIMIT = 256
+
+
+def _mark_done(future: Future):
+    future.done_at = time.monotonic()
+
+
+def _prune_scout_jobs(jobs: OrderedDict):
+    """Evict expired finished jobs, then the oldest finished ones over the limit"""
+    now = time.monotonic()
+    expired = [
+        job_id for job_id, future in jobs.items()
+        if now - getattr(future, 'done_at', now) > _SCOUT_JOB_TTL
+    ]
+    for job_id in expired:
+        del jobs[job_id]
+    
+    excess = len(jobs) - _SCOUT_JOB_LIMIT
+    if excess > 0:
+        finished = [job_id for job_id, future in jobs.items() if future.done()]
+        for job_id in finished[:excess]:
+            del jobs[job_id]
+
+
+def _do_scout(reddit: RedditClient, channel: ChannelProfile,
+              session_id: str, limit: int, db: OutreachDatabase) -> dict:
+    """Fetch posts and scan them with Scout (runs on the scout pool)"""
+    monitor = RedditMonitor(reddit)
+    
+    # Extract subreddit name
+    subreddit_name = channel.name.replace('r/', '')
+    
+    # Get posts
+    posts = monitor.scan_subreddit(subreddit_name, limit=limit)
+    
+    # Scan with Scout
+    scout = OutreachScout(session_id, db=db)
+    opportunities = scout.scan_channel(channel, posts)
+    
+    return {
+        "channel_id": channel.id,
+        "posts_scanned": len(posts),
+        "opportunities_detected": len(opportunities),
+        "opportunities": [o.to_dict() for o in opportunities]
+    }
+
+
 @bp.route('/scout/run', methods=['POST'])
 def run_scout():
     """
-    Run Scout agent on a channel.
+    Start a Scout run on a channel in the background.
     
     Body:
         channel_id: Channel to scan
         session_id: Optional Empirica session ID
         limit: Max posts to scan (default 100)
+    
+    Returns 202 with a job_id; poll /scout/status/<job_id> for results.
     """
     data = request.get_json() or {}
     channel_id = data.get('channel_id')
@@ -285,11 +389,10 @@ def run_scout():
             "message": "Missing 'channel_id' field"
         }), 400
     
-    db = OutreachDatabase()
+    db = get_db()
     channel = db.get_channel(channel_id)
     
     if not channel:
-        db.close()
         return jsonify({
             "ok": False,
             "error": "not_found",
@@ -300,39 +403,33 @@ def run_scout():
     if channel.platform == Platform.REDDIT:
         try:
             reddit = RedditClient.from_env()
-            monitor = RedditMonitor(reddit)
-            
-            # Extract subreddit name
-            subreddit_name = channel.name.replace('r/', '')
-            
-            # Get posts
-            posts = monitor.scan_subreddit(subreddit_name, limit=limit)
-            
-            # Scan with Scout
-            scout = OutreachScout(session_id)
-            opportunities = scout.scan_channel(channel, posts)
-            scout.close()
-            
-            db.close()
-            
-            return jsonify({
-                "ok": True,
-                "channel_id": channel_id,
-                "posts_scanned": len(posts),
-                "opportunities_detected": len(opportunities),
-                "opportunities": [o.to_dict() for o in opportunities]
-            })
-        
         except ValueError as e:
-            db.close()
             return jsonify({
                 "ok": False,
                 "error": "configuration_error",
                 "message": str(e)
             }), 500
+        
+        job_id = str(uuid.uuid4())
+        future = current_app.extensions['scout_pool'].submit(
+            _do_scout, reddit, channel, session_id, limit,
+            current_app.extensions['outreach_db']
+        )
+        future.add_done_callback(_mark_done)
+        
+        jobs = current_app.extensions['scout_jobs']
+        with current_app.extensions['scout_jobs_lock']:
+            _prune_scout_jobs(jobs)
+            jobs[job_id] = future
+        
+        return jsonify({
+            "ok": True,
+            "job_id": job_id,
+            "channel_id": channel_id,
+            "status": "running"
+        }), 202
     
     else:
-        db.close()
         return jsonify({
             "ok": False,
             "error": "not_implemented",
@@ -340,33 +437,64 @@ def run_scout():
         }), 501
 
 
-@bp.route('/stats', methods=['GET'])
-def get_stats():
-    """Get dashboard statistics"""
-    db = OutreachDatabase()
+@bp.route('/scout/status/<job_id>', methods=['GET'])
+def scout_status(job_id):
+    """Get status and results of a background Scout run"""
+    jobs = current_app.extensions['scout_jobs']
+    with current_app.extensions['scout_jobs_lock']:
+        _prune_scout_jobs(jobs)
+        future = jobs.get(job_id)
+    
+    if future is None:
+        return jsonify({
+            "ok": False,
+            "error": "not_found",
+            "message": "Scout job not found"
+        }), 404
     
-    # Count totals
-    all_channels = db.list_channels()
-    all_opportunities = db.list_opportunities(limit=10000)
-    all_drafts = db.list_drafts(status=None, limit=10000)
+    if not future.done():
+        return jsonify({
+            "ok": True,
+            "job_id": job_id,
+            "status": "running"
+        })
     
-    pending_drafts = [d for d in all_drafts if d.status == "pending_review"]
-    approved_drafts = [d for d in all_drafts if d.status == "approved"]
+    error = future.exception()
+    if error is not None:
+        return jsonify({
+            "ok": False,
+            "job_id": job_id,
+            "status": "failed",
+            "error": "scout_failed",
+            "message": str(error)
+        }), 500
     
-    db.close()
+    return jsonify({
+        "ok": True,
+        "job_id": job_id,
+        "status": "done",
+        **future.result()
+    })
+
+
+@bp.route('/stats', methods=['GET'])
+def get_stats():
+    """Get dashboard statistics"""
+    db = get_db()
+    counts = db.get_stats_counts()
     
     return jsonify({
         "ok": True,
         "stats": {
-            "channels": len(all_channels),
+            "channels": counts['channels'],
             "opportunities": {
-                "total": len(all_opportunities),
-                "new": len([o for o in all_opportunities if o.status == "new"])
+                "total": counts['opportunities'],
+                "new": counts['opportunities_new']
             },
             "drafts": {
-                "total": len(all_drafts),
-                "pending_review": len(pending_drafts),
-                "approved": len(approved_drafts)
+                "total": counts['drafts'],
+                "pending_review": counts['drafts_pending_review'],
+                "approved": counts['drafts_approved']
             }
         }
     })
@@ -396,7 +524,14 @@ def manual_submit():
             "message": "Must provide either 'url' or 'text'"
         }), 400
     
-    db = OutreachDatabase()
+    try:
+        platform_enum = _PLATFORM_MAP[platform.lower()]
+    except KeyError:
+        return jsonify({
+            "ok": False,
+            "error": "bad_request",
+            "message": f"Unsupported platform: {platform}"
+        }), 400
     
     try:
         # If URL provided, try to fetch content
@@ -407,10 +542,7 @@ def manual_submit():
             content = text or f"Content from {url}"
         
         # Create a pseudo-channel for manual input
-        from empirica_outreach import models as channel
-        
-        platform_enum = Platform(platform.lower())
-        channel = ChannelProfile(
+        pseudo_channel = ChannelProfile(
             id=f"manual-{platform}",
             platform=platform_enum,
             name=f"Manual {platform.title()} Input",
@@ -466,11 +598,8 @@ def manual_submit():
         }
         
         # Score with Scout agent
-        scout = OutreachScout(session_id)
-        opportunities = scout.scan_channel(channel, [post])
-        scout.close()
-        
-        db.close()
+        scout = OutreachScout(session_id, db=get_db())
+        opportunities = scout.scan_channel(pseudo_channel, [post])
         
         # Return scoring results
         if opportunities:
@@ -494,7 +623,6 @@ def manual_submit():
             })
     
     except Exception as e:
-        db.close()
         return jsonify({
             "ok": False,
             "error": "internal_server_error",
@@ -522,29 +650,13 @@ def score_content():
             "message": "Missing 'text' field"
         }), 400
     
-    # Simple epistemic scoring
-    from empirica_outreach import models as channel
+    keyword_matches, indicators = _scan_score_terms(text)
+    has_question = 'q' in indicators
+    has_technical = 'tech' in indicators
+    has_pain_point = 'pain' in indicators
     
-    # Keyword matching
-    keywords = [
-        'empirica', 'epistemic', 'uncertainty', 'confidence',
-        'calibration', 'alignment', 'grounding', 'self-aware',
-        'context', 'know', 'guess', 'trust'
-    ]
-    
-    text_lower = text.lower()
-    keyword_matches = sum(1 for kw in keywords if kw in text_lower)
     relevance = min(keyword_matches / 5.0, 1.0)  # Normalize
     
-    # Quality indicators
-    has_question = '?' in text
-    has_technical = any(term in text_lower for term in [
-        'implement', 'algorithm', 'architecture', 'api', 'system'
-    ])
-    has_pain_point = any(term in text_lower for term in [
-        'problem', 'issue', 'challenge', 'difficult', 'struggle'
-    ])
-    
     quality = (
         (0.3 if has_question else 0) +
         (0.4 if has_technical else 0) +
@@ -1,10 +1,16 @@
 """Empirica Outreach CLI"""
 
 import click
-import json
-import uuid
+import orjson
+import random
+import secrets
+import sqlite3
+import time
+import urllib.error
+import urllib.request
 from pathlib import Path
 from datetime import datetime
+from typing import Optional, Tuple
 
 from empirica_outreach.models import (
     ChannelProfile, Platform, AudienceProfile, 
@@ -12,7 +18,61 @@ from empirica_outreach.models import (
 )
 from empirica_outreach.storage import OutreachDatabase
 from empirica_outreach.agents import OutreachScout, OutreachDrafter
-from empirica_outreach.integrations import RedditClient, RedditMonitor
+
+# Outreach API used by `scout --async` and `scout-poll`
+DEFAULT_API_URL = "http://localhost:8001/api/v1/outreach"
+
+
+def _echo_json_list(key: str, items):
+    """Write {"ok": true, <key>: [...]} to stdout, encoding one item at a time"""
+    out = click.get_binary_stream('stdout')
+    out.write(f'{{"ok":true,"{key}":['.encode())
+    for i, item in enumerate(items):
+        if i:
+            out.write(b',')
+        out.write(orjson.dumps(item.to_dict()))
+    out.write(b']}\n')
+    out.flush()
+
+
+def _api_request(url: str, payload: Optional[dict] = None) -> Tuple[int, dict]:
+    """Call the outreach API; returns (status, body) for error responses too"""
+    data = orjson.dumps(payload) if payload is not None else None
+    headers = {"Content-Type": "application/json"} if data else {}
+    req = urllib.request.Request(url, data=data, headers=headers)
+    
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, orjson.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        try:
+            return e.code, orjson.loads(e.read())
+        except orjson.JSONDecodeError:
+            return e.code, {"ok": False, "error": "http_error", "message": f"HTTP {e.code}"}
+
+
+def _new_channel(platform: str, name: str, url: str) -> ChannelProfile:
+    """Create a channel profile with sensible defaults"""
+    return ChannelProfile(
+        id=f"{platform}-{name.lower().replace('/', '-')}",
+        platform=Platform(platform),
+        name=name,
+        url=url,
+        epistemic_state={"know": 0.5, "uncertainty": 0.5},
+        audience=AudienceProfile(
+            technical_level=0.7,
+            ai_experience=0.6,
+            openness_to_tools=0.6,
+            pain_points=[],
+            tone_preferences=[]
+        ),
+        strategy=ChannelStrategy(
+            message_framing="problem-led",
+            entry_point="skill",
+            tone="casual-technical"
+        ),
+        constraints=ChannelConstraints()
+    )
 
 
 @click.group()
@@ -39,8 +99,7 @@ def init(project_dir):
     }
     
     config_file = config_dir / 'config.json'
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    config_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2) + b"\n")
     
     click.echo(f"✅ Initialized outreach project in {project_path}")
     click.echo(f"   Config: {config_file}")
@@ -55,27 +114,7 @@ def init(project_dir):
 def channel_add(platform, name, url, output):
     """Add a channel to monitor"""
     
-    # Create channel with sensible defaults
-    channel = ChannelProfile(
-        id=f"{platform}-{name.lower().replace('/', '-')}",
-        platform=Platform(platform),
-        name=name,
-        url=url,
-        epistemic_state={"know": 0.5, "uncertainty": 0.5},
-        audience=AudienceProfile(
-            technical_level=0.7,
-            ai_experience=0.6,
-            openness_to_tools=0.6,
-            pain_points=[],
-            tone_preferences=[]
-        ),
-        strategy=ChannelStrategy(
-            message_framing="problem-led",
-            entry_point="skill",
-            tone="casual-technical"
-        ),
-        constraints=ChannelConstraints()
-    )
+    channel = _new_channel(platform, name, url)
     
     # Save to database
     db = OutreachDatabase()
@@ -83,12 +122,75 @@ def channel_add(platform, name, url, output):
     db.close()
     
     if output == 'json':
-        click.echo(json.dumps({"ok": True, "channel_id": channel.id}))
+        click.echo(orjson.dumps({"ok": True, "channel_id": channel.id}))
     else:
         click.echo(f"✅ Channel added: {channel.name}")
         click.echo(f"   ID: {channel.id}")
 
 
+@cli.command()
+@click.option('--from-jsonl', 'jsonl_file', type=click.File('rb'), required=True,
+              help='JSONL file, one {"platform", "name", "url"} object per line')
+@click.option('--ignore-existing', is_flag=True,
+              help='Skip channels whose ID is already in the database')
+@click.option('--output', type=click.Choice(['json', 'text']), default='text')
+def channel_add_batch(jsonl_file, ignore_existing, output):
+    """Add many channels in a single transaction"""
+    
+    channels = []
+    first_seen = {}  # channel ID -> line number
+    for line_no, line in enumerate(jsonl_file, 1):
+        if not line.strip():
+            continue
+        try:
+            entry = orjson.loads(line)
+            channel = _new_channel(entry['platform'], entry['name'], entry['url'])
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            click.echo(f"❌ Line {line_no}: invalid channel entry ({e})", err=True)
+            return
+        if channel.id in first_seen:
+            click.echo(f"❌ Line {line_no}: duplicate channel {channel.id} "
+                       f"(first on line {first_seen[channel.id]})", err=True)
+            return
+        first_seen[channel.id] = line_no
+        channels.append(channel)
+    
+    db = OutreachDatabase()
+    existing = db.existing_channel_ids(list(first_seen))
+    if existing and not ignore_existing:
+        db.close()
+        click.echo(f"❌ Channels already exist: {', '.join(sorted(existing))} "
+                   f"(use --ignore-existing to skip them)", err=True)
+        return
+    
+    skipped = [c for c in channels if c.id in existing]
+    channels = [c for c in channels if c.id not in existing]
+    
+    # Save to database; OR IGNORE covers channels added since the check above
+    try:
+        db.add_channels(channels, ignore_existing=ignore_existing)
+    except sqlite3.IntegrityError as e:
+        click.echo(f"❌ Could not add channels ({e})", err=True)
+        return
+    finally:
+        db.close()
+    
+    if output == 'json':
+        click.echo(orjson.dumps({
+            "ok": True,
+            "channel_ids": [c.id for c in channels],
+            "skipped_ids": [c.id for c in skipped],
+        }))
+    else:
+        click.echo(f"✅ Channels added: {len(channels)}")
+        for channel in channels:
+            click.echo(f"   • {channel.name} ({channel.id})")
+        if skipped:
+            click.echo(f"⏭️  Skipped (already exist): {len(skipped)}")
+            for channel in skipped:
+                click.echo(f"   • {channel.name} ({channel.id})")
+
+
 @cli.command()
 @click.option('--output', type=click.Choice(['json', 'text']), default='text')
 def channel_list(output):
@@ -98,7 +200,7 @@ def channel_list(output):
     db.close()
     
     if output == 'json':
-        click.echo(json.dumps({
+        click.echo(orjson.dumps({
             "channels": [c.to_dict() for c in channels]
         }))
     else:
@@ -112,12 +214,36 @@ def channel_list(output):
 @click.option('--channel-id', required=True, help='Channel ID')
 @click.option('--session-id', help='Empirica session ID (auto-generated if not provided)')
 @click.option('--limit', default=100, help='Max posts to scan')
+@click.option('--async', 'run_async', is_flag=True,
+              help='Start the scan on the API server and return a job ID')
+@click.option('--api-url', envvar='EMPIRICA_OUTREACH_API', default=DEFAULT_API_URL,
+              help='Outreach API base URL (for --async)')
 @click.option('--output', type=click.Choice(['json', 'text']), default='text')
-def scout(channel_id, session_id, limit, output):
+def scout(channel_id, session_id, limit, run_async, api_url, output):
     """Scan channel for opportunities"""
     
     if not session_id:
-        session_id = f"scout-{uuid.uuid4()}"
+        session_id = f"scout-{secrets.token_hex(8)}"
+    
+    if run_async:
+        try:
+            status, body = _api_request(f"{api_url}/scout/run", {
+                "channel_id": channel_id,
+                "session_id": session_id,
+                "limit": limit
+            })
+        except urllib.error.URLError as e:
+            click.echo(f"❌ Outreach API unreachable at {api_url}: {e.reason}", err=True)
+            return
+        
+        if status != 202:
+            click.echo(f"❌ {body.get('message', body.get('error'))}", err=True)
+        elif output == 'json':
+            click.echo(orjson.dumps(body))
+        else:
+            click.echo(f"🔍 Scout started: {body['job_id']}")
+            click.echo(f"   Poll with: outreach scout-poll {body['job_id']}")
+        return
     
     # Get channel
     db = OutreachDatabase()
@@ -129,6 +255,8 @@ def scout(channel_id, session_id, limit, output):
     
     # Initialize platform client
     if channel.platform == Platform.REDDIT:
+        from empirica_outreach.integrations import RedditClient, RedditMonitor
+        
         try:
             reddit = RedditClient.from_env()
             monitor = RedditMonitor(reddit)
@@ -145,10 +273,7 @@ def scout(channel_id, session_id, limit, output):
             scout_agent.close()
             
             if output == 'json':
-                click.echo(json.dumps({
-                    "ok": True,
-                    "opportunities": [o.to_dict() for o in opportunities]
-                }))
+                _echo_json_list("opportunities", opportunities)
             else:
                 click.echo(f"🔍 Scout Results ({channel.name}):")
                 click.echo(f"   Scanned: {len(posts)} posts")
@@ -171,6 +296,53 @@ def scout(channel_id, session_id, limit, output):
     db.close()
 
 
+@cli.command()
+@click.argument('job_id')
+@click.option('--api-url', envvar='EMPIRICA_OUTREACH_API', default=DEFAULT_API_URL,
+              help='Outreach API base URL')
+@click.option('--timeout', default=600.0, help='Seconds to wait before giving up')
+@click.option('--output', type=click.Choice(['json', 'text']), default='text')
+def scout_poll(job_id, api_url, timeout, output):
+    """Wait for a `scout --async` job and print its results"""
+    
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    
+    while True:
+        try:
+            status, body = _api_request(f"{api_url}/scout/status/{job_id}")
+        except urllib.error.URLError as e:
+            click.echo(f"❌ Outreach API unreachable at {api_url}: {e.reason}", err=True)
+            return
+        
+        if body.get('status') != 'running':
+            break
+        if time.monotonic() >= deadline:
+            click.echo(f"❌ Scout job still running after {timeout:.0f}s: {job_id}", err=True)
+            return
+        
+        # Inverse-exponential backoff: long waits while the fetch is likely
+        # still in flight, tightening towards 0.5s as completion nears
+        time.sleep(max(0.5, 8 * 0.7 ** attempt) + random.uniform(0, 0.5))
+        attempt += 1
+    
+    if not body.get('ok'):
+        click.echo(f"❌ {body.get('message', body.get('error'))}", err=True)
+    elif output == 'json':
+        click.echo(orjson.dumps(body))
+    else:
+        click.echo(f"🔍 Scout Results ({body['channel_id']}):")
+        click.echo(f"   Scanned: {body['posts_scanned']} posts")
+        click.echo(f"   Detected: {body['opportunities_detected']} opportunities")
+        
+        for opp in body['opportunities']:
+            click.echo(f"\n   📌 {opp['type']}")
+            click.echo(f"      Relevance: {opp['relevance_score']:.2f}")
+            click.echo(f"      Confidence: {opp['confidence_to_engage']:.2f}")
+            click.echo(f"      Action: {opp['recommended_action']}")
+            click.echo(f"      Source: {opp['source_url']}")
+
+
 @cli.command()
 @click.option('--opportunity-id', required=True, help='Opportunity ID')
 @click.option('--session-id', help='Empirica session ID')
@@ -180,18 +352,16 @@ def draft(opportunity_id, session_id, variations, output):
     """Create draft response to opportunity"""
     
     if not session_id:
-        session_id = f"draft-{uuid.uuid4()}"
+        session_id = f"draft-{secrets.token_hex(8)}"
     
     db = OutreachDatabase()
     
-    # Get opportunity
-    opportunity = db.get_opportunity(opportunity_id)
-    if not opportunity:
+    # Get opportunity and its channel
+    found = db.get_opportunity_with_channel(opportunity_id)
+    if not found:
         click.echo(f"❌ Opportunity not found: {opportunity_id}", err=True)
         return
-    
-    # Get channel
-    channel = db.get_channel(opportunity.channel_id)
+    opportunity, channel = found
     
     # Create draft
     drafter = OutreachDrafter(session_id)
@@ -199,10 +369,7 @@ def draft(opportunity_id, session_id, variations, output):
     drafter.close()
     
     if output == 'json':
-        click.echo(json.dumps({
-            "ok": True,
-            "drafts": [d.to_dict() for d in drafts]
-        }))
+        _echo_json_list("drafts", drafts)
     else:
         click.echo(f"✏️  Draft Created:")
         for i, draft in enumerate(drafts, 1):
@@ -226,7 +393,7 @@ def review(status, output):
     db.close()
     
     if output == 'json':
-        click.echo(json.dumps({
+        click.echo(orjson.dumps({
             "drafts": [d.to_dict() for d in drafts]
         }))
     else:
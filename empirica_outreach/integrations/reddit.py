@@ -1,52 +1,88 @@
 """Reddit platform integration"""
 
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Deque, List, Dict, Optional, Pattern, Tuple
+from collections import deque
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import os
+import re
 import time
 import random
 import threading
-import praw
-from praw.models import Submission, Comment
+
+# praw is imported lazily so CLI commands that never touch Reddit skip its import cost
+if TYPE_CHECKING:
+    from praw.models import Comment
+
+
+@lru_cache(maxsize=64)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Pattern:
+    """Compile keywords into one case-insensitive substring alternation"""
+    return re.compile('|'.join(re.escape(kw.lower()) for kw in keywords))
+
+
+# Clients built by RedditClient.from_env, keyed by credentials, so repeat
+# scouts in one process share the rate limiter and listing cache (each
+# thread still gets its own PRAW instance, see RedditClient.reddit)
+_CLIENT_CACHE: Dict[tuple, "RedditClient"] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
 
 
 class RedditRateLimiter:
     """
     Token bucket rate limiter for Reddit API.
     
-    Smoothly distributes requests to avoid bursting and rate limit hits.
-    Adds human-like delays between requests.
+    Only blocks once the 60-second window is full. Human-like delays
+    between requests are opt-in (used for posting, not for bulk reads).
     """
     
-    def __init__(self, max_per_minute: int = 55):
+    def __init__(self, max_per_minute: int = 55, humanize: bool = False):
         """
         Initialize rate limiter.
         
         Args:
             max_per_minute: Max requests per minute (default 55, leaving 5 buffer from Reddit's 60)
+            humanize: Add a 1-2s random delay to every request by default
         """
         self.max_per_minute = max_per_minute
-        self.requests = []
+        self.humanize = humanize
+        self.requests: Deque[float] = deque()
         self.lock = threading.Lock()
     
-    def wait_if_needed(self):
-        """Block if rate limit would be exceeded, add human-like delay"""
+    def wait_if_needed(self, humanize: Optional[bool] = None):
+        """
+        Block if rate limit would be exceeded.
+        
+        Args:
+            humanize: Override the limiter's default human-like delay
+        """
+        if humanize is None:
+            humanize = self.humanize
+        
+        # Sleeping while holding the lock is deliberate: it serializes
+        # waiters so they take freed slots in order
         with self.lock:
-            now = time.time()
-            
-            # Remove requests older than 1 minute
-            self.requests = [t for t in self.requests if now - t < 60]
-            
-            if len(self.requests) >= self.max_per_minute:
+            while True:
+                now = time.time()
+                
+                # Remove requests older than 1 minute (oldest first)
+                while self.requests and now - self.requests[0] >= 60:
+                    self.requests.popleft()
+                
+                if len(self.requests) < self.max_per_minute:
+                    break
+                
                 # Wait until oldest request is 60s old
                 sleep_time = 60 - (now - self.requests[0]) + 0.1
                 time.sleep(sleep_time)
-                return self.wait_if_needed()
-            
-            # Add human-like delay (1-2 seconds)
-            # Makes requests indistinguishable from human browsing
-            time.sleep(random.uniform(1.0, 2.0))
             
             self.requests.append(now)
+        
+        if humanize:
+            # Add human-like delay (1-2 seconds) outside the lock so reads
+            # aren't held up behind a post's pause
+            time.sleep(random.uniform(1.0, 2.0))
 
 
 class RedditClient:
@@ -54,11 +90,12 @@ class RedditClient:
     Reddit API client wrapper.
     
     Supports both read-only (Phase 1) and authenticated posting (Phase 2).
-    Includes rate limiting and human-like delays.
+    Includes rate limiting; posting adds human-like delays.
     """
     
     def __init__(self, client_id: str, client_secret: str, user_agent: str,
-                 username: Optional[str] = None, password: Optional[str] = None):
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 listing_cache_ttl: float = 600, search_workers: int = 10):
         """
         Initialize Reddit client.
         
@@ -68,10 +105,23 @@ class RedditClient:
             user_agent: User agent string (e.g., "empirica-outreach/0.1.0")
             username: Reddit username (optional, for posting)
             password: Reddit password (optional, for posting)
+            listing_cache_ttl: Seconds to reuse fetched listings (0 disables)
+            search_workers: Max searches in flight at once in search_many
         """
         # Initialize rate limiter
         self.rate_limiter = RedditRateLimiter(max_per_minute=55)
         
+        # Recently fetched listings, keyed by (path, limit, params)
+        self.listing_cache_ttl = listing_cache_ttl
+        self._listing_cache: Dict[tuple, Tuple[float, List[Dict]]] = {}
+        self._listing_cache_lock = threading.Lock()
+        
+        # Long-lived so its threads keep their PRAW instances (and OAuth
+        # tokens) across calls; created on first use
+        self.search_workers = search_workers
+        self._search_pool: Optional[ThreadPoolExecutor] = None
+        self._search_pool_lock = threading.Lock()
+        
         # Configure PRAW
         praw_config = {
             "client_id": client_id,
@@ -88,11 +138,31 @@ class RedditClient:
         else:
             self.authenticated = False
         
-        self.reddit = praw.Reddit(**praw_config)
+        self._praw_config = praw_config
+        self._local = threading.local()
         
-        # Set read-only if not authenticated
-        if not self.authenticated:
-            self.reddit.read_only = True
+        # Build this thread's instance now so bad config fails at construction
+        self.reddit
+    
+    @property
+    def reddit(self):
+        """
+        This thread's PRAW instance.
+        
+        PRAW instances must not be shared between threads (prawcore's rate
+        limit and token state are unlocked), so each thread using this
+        client gets its own; it is dropped when the thread exits.
+        """
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            import praw
+            
+            reddit = self._local.reddit = praw.Reddit(**self._praw_config)
+            
+            # Set read-only if not authenticated
+            if not self.authenticated:
+                reddit.read_only = True
+        return reddit
     
     def get_recent_posts(self, subreddit_name: str, limit: int = 100,
                         time_filter: str = "day") -> List[Dict]:
@@ -107,29 +177,11 @@ class RedditClient:
         Returns:
             List of post dictionaries
         """
-        self.rate_limiter.wait_if_needed()  # Rate limit + human-like delay
-        
-        subreddit = self.reddit.subreddit(subreddit_name)
-        posts = []
-        
-        for submission in subreddit.new(limit=limit):
-            post = self._submission_to_dict(submission)
-            posts.append(post)
-        
-        return posts
+        return self._fetch_listing(f"r/{subreddit_name}/new", limit)
     
     def get_hot_posts(self, subreddit_name: str, limit: int = 50) -> List[Dict]:
         """Get hot posts from subreddit"""
-        self.rate_limiter.wait_if_needed()
-        
-        subreddit = self.reddit.subreddit(subreddit_name)
-        posts = []
-        
-        for submission in subreddit.hot(limit=limit):
-            post = self._submission_to_dict(submission)
-            posts.append(post)
-        
-        return posts
+        return self._fetch_listing(f"r/{subreddit_name}/hot", limit)
     
     def search_posts(self, subreddit_name: str, query: str, 
                     limit: int = 50, time_filter: str = "week") -> List[Dict]:
@@ -145,14 +197,85 @@ class RedditClient:
         Returns:
             List of matching posts
         """
-        self.rate_limiter.wait_if_needed()
+        return self._fetch_listing(
+            f"r/{subreddit_name}/search",
+            limit,
+            {"q": query, "restrict_sr": "on", "sort": "relevance", "t": time_filter},
+        )
+    
+    def search_many(self, subreddit_name: str, queries: List[str],
+                    limit: int = 50, time_filter: str = "week") -> List[List[Dict]]:
+        """
+        Run several searches concurrently on the client's search pool.
+        
+        Each pool thread uses its own PRAW instance; the shared rate
+        limiter still paces the requests.
         
-        subreddit = self.reddit.subreddit(subreddit_name)
+        Returns:
+            One result list per query, in query order
+        """
+        with self._search_pool_lock:
+            if self._search_pool is None:
+                self._search_pool = ThreadPoolExecutor(
+                    max_workers=self.search_workers, thread_name_prefix='reddit-search'
+                )
+            pool = self._search_pool
+        
+        return list(pool.map(
+            lambda query: self.search_posts(subreddit_name, query, limit, time_filter),
+            queries
+        ))
+    
+    def _fetch_listing(self, path: str, limit: int,
+                       params: Optional[Dict] = None) -> List[Dict]:
+        """
+        Fetch a listing from Reddit's JSON endpoint.
+        
+        Goes through PRAW's authenticated session (keep-alive, token refresh)
+        but parses the listing children directly instead of hydrating
+        Submission objects. Pages of up to 100 are followed via the "after" cursor.
+        
+        Results are reused for listing_cache_ttl seconds, so repeat scouts
+        over the same subreddit/query don't hit Reddit again.
+        """
+        key = (path, limit, tuple(sorted((params or {}).items())))
+        now = time.monotonic()
+        
+        with self._listing_cache_lock:
+            cached = self._listing_cache.get(key)
+            if cached and now - cached[0] < self.listing_cache_ttl:
+                return list(cached[1])
+        
+        posts = self._request_listing(path, limit, params)
+        
+        if self.listing_cache_ttl > 0:
+            with self._listing_cache_lock:
+                # Drop expired entries so the cache only holds the live window
+                for stale in [k for k, (t, _) in self._listing_cache.items()
+                              if now - t >= self.listing_cache_ttl]:
+                    del self._listing_cache[stale]
+                self._listing_cache[key] = (now, posts)
+        
+        return list(posts)
+    
+    def _request_listing(self, path: str, limit: int,
+                         params: Optional[Dict] = None) -> List[Dict]:
+        """Page through a listing endpoint, one rate-limited GET per page"""
+        params = dict(params or {})
         posts = []
         
-        for submission in subreddit.search(query, time_filter=time_filter, limit=limit):
-            post = self._submission_to_dict(submission)
-            posts.append(post)
+        while len(posts) < limit:
+            self.rate_limiter.wait_if_needed()
+            params["limit"] = min(100, limit - len(posts))
+            
+            listing = self.reddit.request(method="GET", path=path, params=params)
+            data = listing["data"]
+            children = data["children"]
+            posts.extend(self._listing_post_to_dict(child["data"]) for child in children)
+            
+            if not children or not data.get("after"):
+                break
+            params["after"] = data["after"]
         
         return posts
     
@@ -167,6 +290,8 @@ class RedditClient:
         Returns:
             List of comment dictionaries
         """
+        from praw.models import Comment
+        
         self.rate_limiter.wait_if_needed()
         
         submission = self.reddit.submission(url=post_url)
@@ -196,41 +321,49 @@ class RedditClient:
         if not self.authenticated:
             raise PermissionError("Authentication required for posting. Set username/password.")
         
-        self.rate_limiter.wait_if_needed()
+        self.rate_limiter.wait_if_needed(humanize=True)  # Rate limit + human-like delay
         
         submission = self.reddit.submission(url=post_url)
         comment = submission.reply(comment_text)
         
         return self._comment_to_dict(comment)
     
-    def _submission_to_dict(self, submission: Submission) -> Dict:
-        """Convert PRAW submission to dictionary"""
+    @staticmethod
+    def _listing_post_to_dict(data: Dict) -> Dict:
+        """Convert raw listing post data to dictionary"""
         return {
-            "id": submission.id,
-            "url": f"https://reddit.com{submission.permalink}",
-            "title": submission.title,
-            "content": submission.selftext,
-            "author": str(submission.author) if submission.author else "[deleted]",
-            "score": submission.score,
-            "num_comments": submission.num_comments,
-            "timestamp": datetime.fromtimestamp(submission.created_utc),
-            "subreddit": str(submission.subreddit),
-            "is_self": submission.is_self,
-            "link_flair_text": submission.link_flair_text,
-            "upvote_ratio": submission.upvote_ratio,
+            "id": data["id"],
+            "url": f"https://reddit.com{data['permalink']}",
+            "title": data["title"],
+            "content": data.get("selftext", ""),
+            "author": data.get("author") or "[deleted]",
+            "score": data.get("score", 0),
+            "num_comments": data.get("num_comments", 0),
+            "timestamp": datetime.fromtimestamp(data["created_utc"]),
+            "subreddit": data["subreddit"],
+            "is_self": data.get("is_self", False),
+            "link_flair_text": data.get("link_flair_text"),
+            "upvote_ratio": data.get("upvote_ratio"),
         }
     
-    def _comment_to_dict(self, comment: Comment) -> Dict:
-        """Convert PRAW comment to dictionary"""
+    def _comment_to_dict(self, comment: "Comment") -> Dict:
+        """
+        Convert PRAW comment to dictionary.
+        
+        Reads the already-loaded fields from the comment's __dict__ so a
+        missing attribute can't trigger one of PRAW's lazy fetches.
+        """
+        data = comment.__dict__
+        author = data.get("author")
         return {
-            "id": comment.id,
-            "url": f"https://reddit.com{comment.permalink}",
-            "content": comment.body,
-            "author": str(comment.author) if comment.author else "[deleted]",
-            "score": comment.score,
-            "timestamp": datetime.fromtimestamp(comment.created_utc),
-            "parent_id": comment.parent_id,
-            "is_submitter": comment.is_submitter,
+            "id": data["id"],
+            "url": f"https://reddit.com{data.get('permalink', '')}",
+            "content": data.get("body", ""),
+            "author": author.name if author else "[deleted]",
+            "score": data.get("score", 0),
+            "timestamp": datetime.fromtimestamp(data["created_utc"]),
+            "parent_id": data.get("parent_id"),
+            "is_submitter": data.get("is_submitter", False),
         }
     
     @classmethod
@@ -238,6 +371,9 @@ class RedditClient:
         """
         Create client from environment variables.
         
+        Clients are cached per set of credentials, so repeated calls return
+        the same instance.
+        
         Requires:
             REDDIT_CLIENT_ID
             REDDIT_CLIENT_SECRET
@@ -246,20 +382,25 @@ class RedditClient:
             REDDIT_USERNAME
             REDDIT_PASSWORD
         """
-        import os
-        
-        client_id = os.getenv("REDDIT_CLIENT_ID")
-        client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-        user_agent = os.getenv("REDDIT_USER_AGENT", "empirica-outreach/0.1.0")
-        username = os.getenv("REDDIT_USERNAME")
-        password = os.getenv("REDDIT_PASSWORD")
+        env = os.environ
+        client_id = env.get("REDDIT_CLIENT_ID")
+        client_secret = env.get("REDDIT_CLIENT_SECRET")
+        user_agent = env.get("REDDIT_USER_AGENT", "empirica-outreach/0.1.0")
+        username = env.get("REDDIT_USERNAME")
+        password = env.get("REDDIT_PASSWORD")
         
         if not client_id or not client_secret:
             raise ValueError(
                 "Missing Reddit credentials. Set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET"
             )
         
-        return cls(client_id, client_secret, user_agent, username, password)
+        key = (client_id, client_secret, user_agent, username or "", password or "")
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = cls(client_id, client_secret, user_agent, username, password)
+                _CLIENT_CACHE[key] = client
+        return client
 
 
 class RedditMonitor:
@@ -269,8 +410,16 @@ class RedditMonitor:
     Combines RedditClient with filtering and rate limiting.
     """
     
-    def __init__(self, client: RedditClient):
+    def __init__(self, client: RedditClient, keywords: Optional[List[str]] = None):
+        """
+        Args:
+            client: Reddit client to fetch with
+            keywords: Default keyword filter for scan_subreddit
+        """
         self.client = client
+        self.keywords = keywords
+        if keywords:
+            _keyword_pattern(tuple(keywords))  # Precompile
     
     def scan_subreddit(self, subreddit_name: str, 
                       keywords: Optional[List[str]] = None,
@@ -280,7 +429,7 @@ class RedditMonitor:
         
         Args:
             subreddit_name: Subreddit to scan
-            keywords: Optional keyword filter
+            keywords: Optional keyword filter (defaults to the monitor's)
             limit: Max posts to retrieve
             
         Returns:
@@ -290,6 +439,7 @@ class RedditMonitor:
         posts = self.client.get_recent_posts(subreddit_name, limit=limit)
         
         # Apply keyword filter if provided
+        keywords = keywords or self.keywords
         if keywords:
             posts = self._filter_by_keywords(posts, keywords)
         
@@ -300,38 +450,33 @@ class RedditMonitor:
         """
         Search for relevant posts using multiple queries.
         
+        Queries run concurrently on the client's search pool (see
+        RedditClient.search_many).
+        
         Args:
             subreddit_name: Subreddit to search
             queries: List of search queries
             limit_per_query: Max results per query
             
         Returns:
-            Combined search results (deduplicated)
+            Combined search results (deduplicated, in query order)
         """
-        all_posts = []
-        seen_ids = set()
-        
-        for query in queries:
-            posts = self.client.search_posts(
-                subreddit_name, 
-                query, 
-                limit=limit_per_query
-            )
-            
-            for post in posts:
-                if post['id'] not in seen_ids:
-                    all_posts.append(post)
-                    seen_ids.add(post['id'])
+        if not queries:
+            return []
+        
+        results = self.client.search_many(subreddit_name, queries, limit=limit_per_query)
         
-        return all_posts
+        # Dedupe by post ID; dicts keep first-seen order
+        return list({post['id']: post for posts in results for post in posts}.values())
     
     def _filter_by_keywords(self, posts: List[Dict], keywords: List[str]) -> List[Dict]:
-        """Filter posts by keywords"""
+        """Filter posts by keywords (one regex scan per post)"""
+        pattern = _keyword_pattern(tuple(keywords))
         filtered = []
         
         for post in posts:
             text = f"{post.get('title', '')} {post.get('content', '')}".lower()
-            if any(kw.lower() in text for kw in keywords):
+            if pattern.search(text):
                 filtered.append(post)
         
         return filtered
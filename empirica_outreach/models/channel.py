@@ -5,6 +5,8 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from enum import Enum
 
+import orjson
+
 
 class Platform(Enum):
     """Supported platforms"""
@@ -15,7 +17,11 @@ class Platform(Enum):
     EMAIL = "email"
 
 
-@dataclass
+# Reverse lookup used by from_dict
+_PLATFORMS = {p.value: p for p in Platform}
+
+
+@dataclass(slots=True)
 class AudienceProfile:
     """What we know about a channel's audience"""
     
@@ -36,7 +42,7 @@ class AudienceProfile:
     confidence: float = 0.5  # How sure are we?
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelStrategy:
     """How to engage this channel"""
     
@@ -52,7 +58,7 @@ class ChannelStrategy:
     avoid: List[str] = field(default_factory=list)  # What not to do
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelConstraints:
     """Hard limits for this channel"""
     
@@ -66,7 +72,7 @@ class ChannelConstraints:
     auto_respond_confidence: float = 0.85
 
 
-@dataclass
+@dataclass(slots=True)
 class EngagementMetrics:
     """Historical engagement metrics"""
     
@@ -79,7 +85,7 @@ class EngagementMetrics:
     best_performer_score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelProfile:
     """Complete profile for a channel"""
     
@@ -110,35 +116,33 @@ class ChannelProfile:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage"""
-        import json
         return {
             'id': self.id,
             'platform': self.platform.value,
             'name': self.name,
             'url': self.url,
-            'epistemic_state': json.dumps(self.epistemic_state),
-            'audience': json.dumps(self.audience.__dict__),
-            'strategy': json.dumps(self.strategy.__dict__),
-            'constraints': json.dumps(self.constraints.__dict__),
-            'engagement_metrics': json.dumps(self.engagement_metrics.__dict__),
+            'epistemic_state': orjson.dumps(self.epistemic_state).decode(),
+            'audience': orjson.dumps(self.audience).decode(),
+            'strategy': orjson.dumps(self.strategy).decode(),
+            'constraints': orjson.dumps(self.constraints).decode(),
+            'engagement_metrics': orjson.dumps(self.engagement_metrics).decode(),
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
         }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'ChannelProfile':
-        """Create from dictionary"""
-        import json
+        """Create from dictionary or sqlite3.Row"""
         return cls(
             id=data['id'],
-            platform=Platform(data['platform']),
+            platform=_PLATFORMS[data['platform']],
             name=data['name'],
             url=data['url'],
-            epistemic_state=json.loads(data['epistemic_state']),
-            audience=AudienceProfile(**json.loads(data['audience'])),
-            strategy=ChannelStrategy(**json.loads(data['strategy'])),
-            constraints=ChannelConstraints(**json.loads(data['constraints'])),
-            engagement_metrics=EngagementMetrics(**json.loads(data['engagement_metrics'])),
+            epistemic_state=orjson.loads(data['epistemic_state']),
+            audience=AudienceProfile(**orjson.loads(data['audience'])),
+            strategy=ChannelStrategy(**orjson.loads(data['strategy'])),
+            constraints=ChannelConstraints(**orjson.loads(data['constraints'])),
+            engagement_metrics=EngagementMetrics(**orjson.loads(data['engagement_metrics'])),
             created_at=datetime.fromisoformat(data['created_at']),
             updated_at=datetime.fromisoformat(data['updated_at']),
         )
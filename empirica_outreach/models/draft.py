@@ -5,6 +5,8 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from enum import Enum
 
+import orjson
+
 
 class ContentType(Enum):
     """Types of content"""
@@ -25,7 +27,12 @@ class DraftStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Stored values -> members for from_dict
+_CONTENT_TYPES = {t.value: t for t in ContentType}
+_DRAFT_STATUSES = {s.value: s for s in DraftStatus}
+
+
+@dataclass(slots=True)
 class EditRecord:
     """Record of an edit made to draft"""
     timestamp: datetime
@@ -36,7 +43,7 @@ class EditRecord:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentDraft:
     """A drafted piece of content"""
     
@@ -79,20 +86,21 @@ class ContentDraft:
     # Metadata
     metadata: Dict = field(default_factory=dict)
     
-    def add_edit(self, editor: str, change_type: str, before: str, after: str, reason: Optional[str] = None):
-        """Record an edit"""
-        self.edits_made.append(EditRecord(
+    def add_edit(self, editor: str, change_type: str, before: str, after: str, reason: Optional[str] = None) -> EditRecord:
+        """Record an edit and return it, for OutreachDatabase.add_draft_edit"""
+        edit = EditRecord(
             timestamp=datetime.utcnow(),
             editor=editor,
             change_type=change_type,
             before=before,
             after=after,
             reason=reason
-        ))
+        )
+        self.edits_made.append(edit)
+        return edit
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage"""
-        import json
         return {
             'id': self.id,
             'opportunity_id': self.opportunity_id,
@@ -100,29 +108,27 @@ class ContentDraft:
             'content_type': self.content_type.value,
             'title': self.title,
             'body': self.body,
-            'semantic_tags': json.dumps(self.semantic_tags),
+            'semantic_tags': orjson.dumps(self.semantic_tags).decode(),
             'confidence_score': self.confidence_score,
             'predicted_engagement': self.predicted_engagement,
-            'uncertainty_flags': json.dumps(self.uncertainty_flags),
+            'uncertainty_flags': orjson.dumps(self.uncertainty_flags).decode(),
             'framing': self.framing,
             'tone': self.tone,
             'status': self.status.value,
             'human_feedback': self.human_feedback,
-            'edits_made': json.dumps([e.__dict__ for e in self.edits_made], default=str),
+            'edits_made': orjson.dumps(self.edits_made).decode(),
             'created_at': self.created_at.isoformat(),
             'reviewed_at': self.reviewed_at.isoformat() if self.reviewed_at else None,
             'posted_at': self.posted_at.isoformat() if self.posted_at else None,
             'post_url': self.post_url,
             'post_id': self.post_id,
-            'metadata': json.dumps(self.metadata),
+            'metadata': orjson.dumps(self.metadata).decode(),
         }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'ContentDraft':
-        """Create from dictionary"""
-        import json
-        
-        edits_data = json.loads(data['edits_made'])
+        """Create from dictionary or sqlite3.Row"""
+        edits_data = orjson.loads(data['edits_made'])
         edits = [
             EditRecord(
                 timestamp=datetime.fromisoformat(e['timestamp']) if isinstance(e['timestamp'], str) else e['timestamp'],
@@ -139,22 +145,22 @@ class ContentDraft:
             id=data['id'],
             opportunity_id=data['opportunity_id'],
             channel_id=data['channel_id'],
-            content_type=ContentType(data['content_type']),
+            content_type=_CONTENT_TYPES[data['content_type']],
             title=data['title'],
             body=data['body'],
-            semantic_tags=json.loads(data['semantic_tags']),
+            semantic_tags=orjson.loads(data['semantic_tags']),
             confidence_score=data['confidence_score'],
             predicted_engagement=data['predicted_engagement'],
-            uncertainty_flags=json.loads(data['uncertainty_flags']),
+            uncertainty_flags=orjson.loads(data['uncertainty_flags']),
             framing=data['framing'],
             tone=data['tone'],
-            status=DraftStatus(data['status']),
+            status=_DRAFT_STATUSES[data['status']],
             human_feedback=data['human_feedback'],
             edits_made=edits,
             created_at=datetime.fromisoformat(data['created_at']),
-            reviewed_at=datetime.fromisoformat(data['reviewed_at']) if data.get('reviewed_at') else None,
-            posted_at=datetime.fromisoformat(data['posted_at']) if data.get('posted_at') else None,
+            reviewed_at=datetime.fromisoformat(data['reviewed_at']) if data['reviewed_at'] else None,
+            posted_at=datetime.fromisoformat(data['posted_at']) if data['posted_at'] else None,
             post_url=data['post_url'],
             post_id=data['post_id'],
-            metadata=json.loads(data['metadata']),
+            metadata=orjson.loads(data['metadata']),
         )
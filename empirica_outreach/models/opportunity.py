@@ -5,6 +5,8 @@ from typing import Dict, Optional
 from datetime import datetime
 from enum import Enum
 
+import orjson
+
 
 class OpportunityType(Enum):
     """Types of engagement opportunities"""
@@ -32,7 +34,13 @@ class ActionType(Enum):
     SKIP = "skip"
 
 
-@dataclass
+# Stored value -> member, so from_dict skips the Enum constructor per row
+_OPPORTUNITY_TYPES = {t.value: t for t in OpportunityType}
+_OPPORTUNITY_STATUSES = {s.value: s for s in OpportunityStatus}
+_ACTION_TYPES = {a.value: a for a in ActionType}
+
+
+@dataclass(slots=True)
 class Opportunity:
     """A detected opportunity for engagement"""
     
@@ -73,7 +81,6 @@ class Opportunity:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage"""
-        import json
         return {
             'id': self.id,
             'channel_id': self.channel_id,
@@ -85,7 +92,7 @@ class Opportunity:
             'relevance_score': self.relevance_score,
             'engagement_potential': self.engagement_potential,
             'urgency': self.urgency,
-            'epistemic_assessment': json.dumps(self.epistemic_assessment),
+            'epistemic_assessment': orjson.dumps(self.epistemic_assessment).decode(),
             'confidence_to_engage': self.confidence_to_engage,
             'recommended_action': self.recommended_action.value,
             'reasoning': self.reasoning,
@@ -93,17 +100,16 @@ class Opportunity:
             'detected_at': self.detected_at.isoformat(),
             'reviewed_at': self.reviewed_at.isoformat() if self.reviewed_at else None,
             'engaged_at': self.engaged_at.isoformat() if self.engaged_at else None,
-            'metadata': json.dumps(self.metadata),
+            'metadata': orjson.dumps(self.metadata).decode(),
         }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Opportunity':
-        """Create from dictionary"""
-        import json
+        """Create from dictionary or sqlite3.Row"""
         return cls(
             id=data['id'],
             channel_id=data['channel_id'],
-            type=OpportunityType(data['type']),
+            type=_OPPORTUNITY_TYPES[data['type']],
             source_url=data['source_url'],
             source_content=data['source_content'],
             source_author=data['source_author'],
@@ -111,13 +117,13 @@ class Opportunity:
             relevance_score=data['relevance_score'],
             engagement_potential=data['engagement_potential'],
             urgency=data['urgency'],
-            epistemic_assessment=json.loads(data['epistemic_assessment']),
+            epistemic_assessment=orjson.loads(data['epistemic_assessment']),
             confidence_to_engage=data['confidence_to_engage'],
-            recommended_action=ActionType(data['recommended_action']),
+            recommended_action=_ACTION_TYPES[data['recommended_action']],
             reasoning=data['reasoning'],
-            status=OpportunityStatus(data['status']),
+            status=_OPPORTUNITY_STATUSES[data['status']],
             detected_at=datetime.fromisoformat(data['detected_at']),
-            reviewed_at=datetime.fromisoformat(data['reviewed_at']) if data.get('reviewed_at') else None,
-            engaged_at=datetime.fromisoformat(data['engaged_at']) if data.get('engaged_at') else None,
-            metadata=json.loads(data['metadata']),
+            reviewed_at=datetime.fromisoformat(data['reviewed_at']) if data['reviewed_at'] else None,
+            engaged_at=datetime.fromisoformat(data['engaged_at']) if data['engaged_at'] else None,
+            metadata=orjson.loads(data['metadata']),
         )
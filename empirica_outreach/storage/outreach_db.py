@@ -1,16 +1,168 @@
 """Outreach database storage layer"""
 
 import sqlite3
-import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 from datetime import datetime
 
-from empirica_outreach.models import ChannelProfile, Opportunity, ContentDraft
+import orjson
+
+from empirica_outreach.models import (
+    ChannelProfile, EngagementMetrics, Opportunity, ContentDraft, EditRecord
+)
+
+# Channel profiles rarely change, so get_channel is served from a small
+# process-wide LRU keyed by (db_path, channel_id). It holds the immutable
+# stored row and each hit decodes a fresh ChannelProfile, so callers can't
+# see each other's mutations. Writes through this process invalidate their
+# entry; the TTL bounds staleness from other processes.
+_CHANNEL_CACHE_SIZE = 128
+_CHANNEL_CACHE_TTL = 3600  # seconds
+_channel_cache: "OrderedDict[Tuple[str, str], Tuple[float, sqlite3.Row]]" = OrderedDict()
+_channel_cache_lock = threading.Lock()
+
+# Statements are module constants so every call passes the identical string
+# and hits the connection's statement cache
+_INSERT_CHANNEL = """
+    INSERT INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_CHANNEL_OR_IGNORE = """
+    INSERT OR IGNORE INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_OPPORTUNITY = """
+    INSERT INTO opportunities VALUES 
+    (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_DRAFT = """
+    INSERT INTO drafts VALUES 
+    (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Column definitions for drafts, shared with the table rebuild in
+# _migrate_draft_edits
+_DRAFTS_SCHEMA = """
+    id TEXT PRIMARY KEY,
+    opportunity_id TEXT,
+    channel_id TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    title TEXT,
+    body TEXT NOT NULL,
+    semantic_tags TEXT NOT NULL,
+    confidence_score REAL NOT NULL,
+    predicted_engagement REAL NOT NULL,
+    uncertainty_flags TEXT NOT NULL,
+    framing TEXT NOT NULL,
+    tone TEXT NOT NULL,
+    status TEXT NOT NULL,
+    human_feedback TEXT,
+    created_at TEXT NOT NULL,
+    reviewed_at TEXT,
+    posted_at TEXT,
+    post_url TEXT,
+    post_id TEXT,
+    metadata TEXT NOT NULL,
+    FOREIGN KEY (opportunity_id) REFERENCES opportunities(id),
+    FOREIGN KEY (channel_id) REFERENCES channels(id)
+"""
+_SELECT_CHANNEL = "SELECT * FROM channels WHERE id = ?"
+_SELECT_CHANNELS = "SELECT * FROM channels ORDER BY created_at DESC"
+# IDs are passed as one JSON array so the statement text never varies
+_SELECT_EXISTING_CHANNEL_IDS = """
+    SELECT id FROM channels WHERE id IN (SELECT value FROM json_each(?))
+"""
+_SELECT_OPPORTUNITY = "SELECT * FROM opportunities WHERE id = ?"
+_SELECT_OPPORTUNITY_WITH_CHANNEL = """
+    SELECT o.*, c.* FROM opportunities o
+    LEFT JOIN channels c ON c.id = o.channel_id
+    WHERE o.id = ?
+"""
+# Drafts with their edit history from draft_edits, folded back into the
+# edits_made JSON column that ContentDraft.to_dict()/from_dict() use
+_SELECT_DRAFTS = """
+    SELECT drafts.*, (
+        SELECT json_group_array(json_object(
+            'timestamp', timestamp, 'editor', editor, 'change_type', change_type,
+            'before', before, 'after', after, 'reason', reason
+        ))
+        FROM (SELECT * FROM draft_edits
+              WHERE draft_edits.draft_id = drafts.id ORDER BY timestamp, id)
+    ) AS edits_made
+    FROM drafts
+"""
+_SELECT_DRAFT = _SELECT_DRAFTS + " WHERE id = ?"
+_UPDATE_CHANNEL = """
+    UPDATE channels 
+    SET platform=?, name=?, url=?, epistemic_state=?, audience=?, 
+        strategy=?, constraints=?, engagement_metrics=?, updated_at=?
+    WHERE id=?
+"""
+_UPDATE_OPPORTUNITY_STATUS = """
+    UPDATE opportunities SET status = ? WHERE id = ?
+"""
+_UPDATE_DRAFT = """
+    UPDATE drafts 
+    SET body=?, status=?, human_feedback=?, reviewed_at=?,
+        posted_at=?, post_url=?, post_id=?
+    WHERE id=?
+"""
+_UPDATE_DRAFT_STATUS = """
+    UPDATE drafts SET status=?, human_feedback=?, reviewed_at=? WHERE id=?
+"""
+_UPDATE_DRAFT_BODY = """
+    UPDATE drafts SET body=? WHERE id=?
+"""
+_INSERT_DRAFT_EDIT = """
+    INSERT INTO draft_edits (draft_id, timestamp, editor, change_type, before, after, reason)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_COUNT_DRAFT_EDITS = "SELECT COUNT(*) FROM draft_edits WHERE draft_id = ?"
+_MARK_DRAFT_POSTED = """
+    UPDATE drafts SET status='posted', posted_at=?, post_url=?, post_id=? WHERE id=?
+"""
+_UPDATE_CHANNEL_METRICS = """
+    UPDATE channels SET engagement_metrics=?, updated_at=? WHERE id=?
+"""
+
+
+@lru_cache(maxsize=None)
+def _filtered_select(select: str, filters: Tuple[str, ...],
+                     order_by: str, limited: bool) -> str:
+    """Build (once per filter combination) a SELECT with AND-ed equality filters"""
+    query = f"{select} WHERE 1=1"
+    for column in filters:
+        query += f" AND {column} = ?"
+    query += f" ORDER BY {order_by} DESC"
+    if limited:
+        query += " LIMIT ?"
+    return query
+
+
+class _ThreadConnection:
+    """
+    One thread's connection.
+    
+    Only that thread's locals reference it, so when the thread exits it
+    is collected and the connection closed.
+    """
+    
+    __slots__ = ('conn', '__weakref__')
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
 
 
 class OutreachDatabase:
-    """SQLite database for outreach data"""
+    """SQLite database for outreach data
+    
+    Each thread gets its own connection, opened on first use and closed
+    when the thread exits, so one instance can be shared by all API
+    worker threads.
+    """
     
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
@@ -19,11 +171,47 @@ class OutreachDatabase:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.conn = sqlite3.connect(str(self.db_path))
-        self.conn.row_factory = sqlite3.Row
+        self._local = threading.local()
+        # Live threads' connections, for close(); weak so exited threads drop out
+        self._connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
         
         self._create_tables()
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection"""
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            holder = self._local.holder = _ThreadConnection(self._connect())
+            with self._connections_lock:
+                self._connections.add(holder)
+        return holder.conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a new connection"""
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+    
+    @staticmethod
+    def _apply_pragmas(conn: sqlite3.Connection):
+        """Tune the connection for many small writes and full-row scans"""
+        # WAL lets readers proceed while another connection writes; with WAL,
+        # synchronous=NORMAL only fsyncs at checkpoints and stays crash-safe
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Serve reads from a 256 MiB memory map instead of a read() per page.
+        # The mapped pages are the OS page cache, shared by every connection,
+        # so each thread's private page cache stays at SQLite's ~2 MiB default
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Wait for a concurrent writer instead of failing with "database is locked"
+        conn.execute("PRAGMA busy_timeout=5000")
+    
     def _create_tables(self):
         """Create database schema"""
         
@@ -71,165 +259,372 @@ class OutreachDatabase:
         """)
         
         # Drafts table
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS drafts ({_DRAFTS_SCHEMA})")
+        
+        # Append-only edit history, so an edit is an INSERT rather than a
+        # rewrite of the whole history
         self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS drafts (
-                id TEXT PRIMARY KEY,
-                opportunity_id TEXT,
-                channel_id TEXT NOT NULL,
-                content_type TEXT NOT NULL,
-                title TEXT,
-                body TEXT NOT NULL,
-                semantic_tags TEXT NOT NULL,
-                confidence_score REAL NOT NULL,
-                predicted_engagement REAL NOT NULL,
-                uncertainty_flags TEXT NOT NULL,
-                framing TEXT NOT NULL,
-                tone TEXT NOT NULL,
-                status TEXT NOT NULL,
-                human_feedback TEXT,
-                edits_made TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                reviewed_at TEXT,
-                posted_at TEXT,
-                post_url TEXT,
-                post_id TEXT,
-                metadata TEXT NOT NULL,
-                FOREIGN KEY (opportunity_id) REFERENCES opportunities(id),
-                FOREIGN KEY (channel_id) REFERENCES channels(id)
+            CREATE TABLE IF NOT EXISTS draft_edits (
+                id INTEGER PRIMARY KEY,
+                draft_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                editor TEXT NOT NULL,
+                change_type TEXT NOT NULL,
+                before TEXT NOT NULL,
+                after TEXT NOT NULL,
+                reason TEXT,
+                FOREIGN KEY (draft_id) REFERENCES drafts(id)
             )
         """)
         
-        # Indexes
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_opportunities_channel ON opportunities(channel_id)")
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_opportunities_status ON opportunities(status)")
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_channel ON drafts(channel_id)")
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_status ON drafts(status)")
+        # Before the indexes: the rebuild replaces the drafts table
+        self._migrate_draft_edits()
+        
+        # Indexes matching the list queries: equality filters first, then the
+        # ORDER BY column so rows come back pre-sorted
+        for old_index in ("idx_opportunities_channel", "idx_opportunities_status",
+                          "idx_drafts_channel", "idx_drafts_status", "idx_drafts_opp"):
+            self.conn.execute(f"DROP INDEX IF EXISTS {old_index}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_opp_chan_status_time ON opportunities(channel_id, status, detected_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_opp_chan_time ON opportunities(channel_id, detected_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_opp_status_time ON opportunities(status, detected_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_opp_time ON opportunities(detected_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_chan_status_time ON drafts(channel_id, status, created_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_chan_time ON drafts(channel_id, created_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_status_time ON drafts(status, created_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_opp_time ON drafts(opportunity_id, created_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_time ON drafts(created_at DESC)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_draft_edits_draft ON draft_edits(draft_id, timestamp)")
         
         self.conn.commit()
+        
+        # Width of an opportunities row, for splitting joined opportunity/channel rows
+        self._opportunity_width = self._scalar(
+            "SELECT COUNT(*) FROM pragma_table_info('opportunities')"
+        )
+    
+    def _raw_cursor(self) -> sqlite3.Cursor:
+        """Cursor returning plain tuples, for queries that don't need sqlite3.Row"""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
+    
+    def _scalar(self, sql: str, params: tuple = ()):
+        """First column of the first row, or None"""
+        row = self._raw_cursor().execute(sql, params).fetchone()
+        return row[0] if row else None
+    
+    def _migrate_draft_edits(self):
+        """
+        Move edit histories from the old drafts.edits_made column to draft_edits.
+        
+        The column is removed by rebuilding the table (ALTER TABLE ... DROP
+        COLUMN needs SQLite 3.35+), all under one write lock so processes
+        opening the database at the same time migrate it exactly once.
+        """
+        has_column_sql = (
+            "SELECT COUNT(*) FROM pragma_table_info('drafts') WHERE name = 'edits_made'"
+        )
+        if not self._scalar(has_column_sql):
+            return
+        
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock
+            if not self._scalar(has_column_sql):
+                self.conn.rollback()
+                return
+            
+            for row in self.conn.execute(
+                "SELECT id, edits_made FROM drafts WHERE edits_made != '[]'"
+            ).fetchall():
+                for edit in orjson.loads(row['edits_made']):
+                    self.conn.execute(_INSERT_DRAFT_EDIT, (
+                        row['id'], datetime.fromisoformat(edit['timestamp']).isoformat(),
+                        edit['editor'], edit['change_type'], edit['before'],
+                        edit['after'], edit.get('reason')
+                    ))
+            
+            self.conn.execute(f"CREATE TABLE drafts_new ({_DRAFTS_SCHEMA})")
+            columns = ", ".join(
+                row[0] for row in self._raw_cursor().execute(
+                    "SELECT name FROM pragma_table_info('drafts_new')"
+                )
+            )
+            self.conn.execute(
+                f"INSERT INTO drafts_new ({columns}) SELECT {columns} FROM drafts"
+            )
+            self.conn.execute("DROP TABLE drafts")
+            self.conn.execute("ALTER TABLE drafts_new RENAME TO drafts")
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+    
+    def _insert_many(self, sql: str, rows: List[tuple], commit: bool):
+        """
+        executemany in one transaction.
+        
+        With commit=False the rows stay in the open transaction so callers
+        can batch several adds and commit once.
+        """
+        if commit:
+            with self.conn:
+                self.conn.executemany(sql, rows)
+        else:
+            self.conn.executemany(sql, rows)
     
     # Channel operations
-    def add_channel(self, channel: ChannelProfile):
+    def add_channel(self, channel: ChannelProfile, commit: bool = True):
         """Add a channel"""
+        self.add_channels([channel], commit=commit)
+    
+    def add_channels(self, channels: List[ChannelProfile], commit: bool = True,
+                     ignore_existing: bool = False):
+        """
+        Add channels in a single transaction.
+        
+        Raises sqlite3.IntegrityError on an ID that is already stored,
+        unless ignore_existing is set, in which case that channel is
+        left as it is.
+        """
+        rows = [self._channel_row(c) for c in channels]
+        sql = _INSERT_CHANNEL_OR_IGNORE if ignore_existing else _INSERT_CHANNEL
+        self._insert_many(sql, rows, commit)
+        for channel in channels:
+            self._invalidate_channel(channel.id)
+    
+    def existing_channel_ids(self, channel_ids: List[str]) -> Set[str]:
+        """Those of channel_ids that are already stored"""
+        cursor = self._raw_cursor().execute(
+            _SELECT_EXISTING_CHANNEL_IDS, (orjson.dumps(channel_ids).decode(),)
+        )
+        return {row[0] for row in cursor}
+    
+    @staticmethod
+    def _channel_row(channel: ChannelProfile) -> tuple:
+        """Channel as an INSERT parameter tuple"""
         data = channel.to_dict()
-        self.conn.execute("""
-            INSERT INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             data['id'], data['platform'], data['name'], data['url'],
             data['epistemic_state'], data['audience'], data['strategy'],
             data['constraints'], data['engagement_metrics'],
             data['created_at'], data['updated_at']
-        ))
-        self.conn.commit()
+        )
     
     def get_channel(self, channel_id: str) -> Optional[ChannelProfile]:
-        """Get channel by ID"""
-        cursor = self.conn.execute("SELECT * FROM channels WHERE id = ?", (channel_id,))
+        """Get channel by ID (row cached; every call returns a new object)"""
+        key = (str(self.db_path), channel_id)
+        now = time.monotonic()
+        
+        with _channel_cache_lock:
+            cached = _channel_cache.get(key)
+            if cached and now - cached[0] < _CHANNEL_CACHE_TTL:
+                _channel_cache.move_to_end(key)
+                return ChannelProfile.from_dict(cached[1])
+        
+        cursor = self.conn.execute(_SELECT_CHANNEL, (channel_id,))
         row = cursor.fetchone()
-        if row:
-            return ChannelProfile.from_dict(dict(row))
-        return None
+        if not row:
+            return None
+        
+        with _channel_cache_lock:
+            _channel_cache[key] = (now, row)
+            _channel_cache.move_to_end(key)
+            if len(_channel_cache) > _CHANNEL_CACHE_SIZE:
+                _channel_cache.popitem(last=False)
+        return ChannelProfile.from_dict(row)
+    
+    def _invalidate_channel(self, channel_id: str):
+        """Drop a channel from the lookup cache after a write"""
+        with _channel_cache_lock:
+            _channel_cache.pop((str(self.db_path), channel_id), None)
     
     def list_channels(self) -> List[ChannelProfile]:
         """List all channels"""
-        cursor = self.conn.execute("SELECT * FROM channels ORDER BY created_at DESC")
-        return [ChannelProfile.from_dict(dict(row)) for row in cursor.fetchall()]
+        return list(self.iter_channels())
+    
+    def iter_channels(self) -> Iterator[ChannelProfile]:
+        """Iterate all channels, one row at a time"""
+        for row in self._select_channels():
+            yield ChannelProfile.from_dict(row)
+    
+    def iter_channel_rows(self) -> Iterator[Dict]:
+        """Iterate channels as stored rows (the ChannelProfile.to_dict() shape)"""
+        for row in self._select_channels():
+            yield dict(row)
+    
+    def _select_channels(self) -> sqlite3.Cursor:
+        """Cursor over all channel rows, newest first"""
+        return self.conn.execute(_SELECT_CHANNELS)
     
     def update_channel(self, channel: ChannelProfile):
         """Update channel"""
         channel.updated_at = datetime.utcnow()
         data = channel.to_dict()
-        self.conn.execute("""
-            UPDATE channels 
-            SET platform=?, name=?, url=?, epistemic_state=?, audience=?, 
-                strategy=?, constraints=?, engagement_metrics=?, updated_at=?
-            WHERE id=?
-        """, (
+        self.conn.execute(_UPDATE_CHANNEL, (
             data['platform'], data['name'], data['url'], data['epistemic_state'],
             data['audience'], data['strategy'], data['constraints'],
             data['engagement_metrics'], data['updated_at'], data['id']
         ))
         self.conn.commit()
+        self._invalidate_channel(channel.id)
+    
+    def update_channel_metrics(self, channel_id: str, metrics: EngagementMetrics) -> bool:
+        """Update only a channel's engagement metrics. Returns False if not found."""
+        cursor = self.conn.execute(_UPDATE_CHANNEL_METRICS, (
+            orjson.dumps(metrics).decode(), datetime.utcnow().isoformat(), channel_id
+        ))
+        self.conn.commit()
+        self._invalidate_channel(channel_id)
+        return cursor.rowcount > 0
     
     # Opportunity operations
-    def add_opportunity(self, opportunity: Opportunity):
+    def add_opportunity(self, opportunity: Opportunity, commit: bool = True):
         """Add opportunity"""
+        self.add_opportunities([opportunity], commit=commit)
+    
+    def add_opportunities(self, opportunities: List[Opportunity], commit: bool = True):
+        """Add opportunities in a single transaction"""
+        rows = [self._opportunity_row(o) for o in opportunities]
+        self._insert_many(_INSERT_OPPORTUNITY, rows, commit)
+    
+    @staticmethod
+    def _opportunity_row(opportunity: Opportunity) -> tuple:
+        """Opportunity as an INSERT parameter tuple"""
         data = opportunity.to_dict()
-        self.conn.execute("""
-            INSERT INTO opportunities VALUES 
-            (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             data['id'], data['channel_id'], data['type'], data['source_url'],
             data['source_content'], data['source_author'], data['source_timestamp'],
             data['relevance_score'], data['engagement_potential'], data['urgency'],
             data['epistemic_assessment'], data['confidence_to_engage'],
             data['recommended_action'], data['reasoning'], data['status'],
             data['detected_at'], data['reviewed_at'], data['engaged_at'], data['metadata']
-        ))
-        self.conn.commit()
+        )
     
     def get_opportunity(self, opportunity_id: str) -> Optional[Opportunity]:
         """Get opportunity by ID"""
-        cursor = self.conn.execute("SELECT * FROM opportunities WHERE id = ?", (opportunity_id,))
+        cursor = self.conn.execute(_SELECT_OPPORTUNITY, (opportunity_id,))
         row = cursor.fetchone()
         if row:
-            return Opportunity.from_dict(dict(row))
+            return Opportunity.from_dict(row)
         return None
     
+    def get_opportunity_with_channel(self, opportunity_id: str
+                                     ) -> Optional[Tuple[Opportunity, Optional[ChannelProfile]]]:
+        """Get opportunity and its channel in one query"""
+        cursor = self.conn.execute(_SELECT_OPPORTUNITY_WITH_CHANNEL, (opportunity_id,))
+        row = cursor.fetchone()
+        if row:
+            return self._split_opportunity_channel(row)
+        return None
+    
+    def get_opportunities_with_channels(self, opportunity_ids: List[str]
+                                        ) -> Dict[str, Tuple[Opportunity, Optional[ChannelProfile]]]:
+        """Get several opportunities and their channels in one query, keyed by opportunity ID"""
+        if not opportunity_ids:
+            return {}
+        placeholders = ", ".join("?" * len(opportunity_ids))
+        cursor = self.conn.execute(f"""
+            SELECT o.*, c.* FROM opportunities o
+            LEFT JOIN channels c ON c.id = o.channel_id
+            WHERE o.id IN ({placeholders})
+        """, list(opportunity_ids))
+        pairs = (self._split_opportunity_channel(row) for row in cursor)
+        return {opportunity.id: (opportunity, channel) for opportunity, channel in pairs}
+    
+    def _split_opportunity_channel(self, row: sqlite3.Row
+                                   ) -> Tuple[Opportunity, Optional[ChannelProfile]]:
+        """Split an opportunities-JOIN-channels row into both models"""
+        width = self._opportunity_width
+        keys, values = row.keys(), tuple(row)
+        opportunity = Opportunity.from_dict(dict(zip(keys[:width], values[:width])))
+        channel = None
+        if values[width] is not None:
+            channel = ChannelProfile.from_dict(dict(zip(keys[width:], values[width:])))
+        return opportunity, channel
+    
     def list_opportunities(self, channel_id: Optional[str] = None, 
                           status: Optional[str] = None,
                           limit: Optional[int] = None) -> List[Opportunity]:
         """List opportunities with optional filters"""
-        query = "SELECT * FROM opportunities WHERE 1=1"
-        params = []
-        
-        if channel_id:
-            query += " AND channel_id = ?"
-            params.append(channel_id)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        
-        query += " ORDER BY detected_at DESC"
+        return list(self.iter_opportunities(channel_id, status, limit))
+    
+    def iter_opportunities(self, channel_id: Optional[str] = None,
+                           status: Optional[str] = None,
+                           limit: Optional[int] = None) -> Iterator[Opportunity]:
+        """Iterate opportunities with optional filters, one row at a time"""
+        for row in self._select_opportunities(channel_id, status, limit):
+            yield Opportunity.from_dict(row)
+    
+    def iter_opportunity_rows(self, channel_id: Optional[str] = None,
+                              status: Optional[str] = None,
+                              limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Iterate opportunities as stored rows (the Opportunity.to_dict() shape).
         
+        For callers that only re-serialize, this skips decoding the JSON
+        columns into models and encoding them again.
+        """
+        for row in self._select_opportunities(channel_id, status, limit):
+            yield dict(row)
+    
+    def _select_opportunities(self, channel_id: Optional[str],
+                              status: Optional[str],
+                              limit: Optional[int]) -> sqlite3.Cursor:
+        """Cursor over filtered opportunity rows, newest first"""
+        filters = {"channel_id": channel_id, "status": status}
+        columns = tuple(column for column, value in filters.items() if value)
+        params = [filters[column] for column in columns]
         if limit:
-            query += " LIMIT ?"
             params.append(limit)
         
-        cursor = self.conn.execute(query, params)
-        return [Opportunity.from_dict(dict(row)) for row in cursor.fetchall()]
+        query = _filtered_select("SELECT * FROM opportunities", columns, "detected_at", bool(limit))
+        return self.conn.execute(query, params)
     
     def update_opportunity_status(self, opportunity_id: str, status: str):
         """Update opportunity status"""
-        self.conn.execute("""
-            UPDATE opportunities SET status = ? WHERE id = ?
-        """, (status, opportunity_id))
+        self.conn.execute(_UPDATE_OPPORTUNITY_STATUS, (status, opportunity_id))
         self.conn.commit()
     
     # Draft operations
-    def add_draft(self, draft: ContentDraft):
+    def add_draft(self, draft: ContentDraft, commit: bool = True):
         """Add draft"""
+        self.add_drafts([draft], commit=commit)
+    
+    def add_drafts(self, drafts: List[ContentDraft], commit: bool = True):
+        """Add drafts, and any edits already on them, in a single transaction"""
+        rows = [self._draft_row(d) for d in drafts]
+        edits = [self._draft_edit_row(d.id, e) for d in drafts for e in d.edits_made]
+        if commit:
+            with self.conn:
+                self.conn.executemany(_INSERT_DRAFT, rows)
+                self.conn.executemany(_INSERT_DRAFT_EDIT, edits)
+        else:
+            self.conn.executemany(_INSERT_DRAFT, rows)
+            self.conn.executemany(_INSERT_DRAFT_EDIT, edits)
+    
+    @staticmethod
+    def _draft_row(draft: ContentDraft) -> tuple:
+        """Draft as an INSERT parameter tuple"""
         data = draft.to_dict()
-        self.conn.execute("""
-            INSERT INTO drafts VALUES 
-            (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             data['id'], data['opportunity_id'], data['channel_id'],
             data['content_type'], data['title'], data['body'],
             data['semantic_tags'], data['confidence_score'],
             data['predicted_engagement'], data['uncertainty_flags'],
             data['framing'], data['tone'], data['status'],
-            data['human_feedback'], data['edits_made'], data['created_at'],
+            data['human_feedback'], data['created_at'],
             data['reviewed_at'], data['posted_at'], data['post_url'],
             data['post_id'], data['metadata']
-        ))
-        self.conn.commit()
+        )
     
     def get_draft(self, draft_id: str) -> Optional[ContentDraft]:
         """Get draft by ID"""
-        cursor = self.conn.execute("SELECT * FROM drafts WHERE id = ?", (draft_id,))
+        cursor = self.conn.execute(_SELECT_DRAFT, (draft_id,))
         row = cursor.fetchone()
         if row:
-            return ContentDraft.from_dict(dict(row))
+            return ContentDraft.from_dict(row)
         return None
     
     def list_drafts(self, channel_id: Optional[str] = None,
@@ -237,46 +632,123 @@ class OutreachDatabase:
                    opportunity_id: Optional[str] = None,
                    limit: Optional[int] = None) -> List[ContentDraft]:
         """List drafts with optional filters"""
-        query = "SELECT * FROM drafts WHERE 1=1"
-        params = []
-        
-        if channel_id:
-            query += " AND channel_id = ?"
-            params.append(channel_id)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if opportunity_id:
-            query += " AND opportunity_id = ?"
-            params.append(opportunity_id)
-        
-        query += " ORDER BY created_at DESC"
-        
+        return list(self.iter_drafts(channel_id, status, opportunity_id, limit))
+    
+    def iter_drafts(self, channel_id: Optional[str] = None,
+                    status: Optional[str] = None,
+                    opportunity_id: Optional[str] = None,
+                    limit: Optional[int] = None) -> Iterator[ContentDraft]:
+        """Iterate drafts with optional filters, one row at a time"""
+        for row in self._select_drafts(channel_id, status, opportunity_id, limit):
+            yield ContentDraft.from_dict(row)
+    
+    def iter_draft_rows(self, channel_id: Optional[str] = None,
+                        status: Optional[str] = None,
+                        opportunity_id: Optional[str] = None,
+                        limit: Optional[int] = None) -> Iterator[Dict]:
+        """Iterate drafts as stored rows (the ContentDraft.to_dict() shape)"""
+        for row in self._select_drafts(channel_id, status, opportunity_id, limit):
+            yield dict(row)
+    
+    def _select_drafts(self, channel_id: Optional[str],
+                       status: Optional[str],
+                       opportunity_id: Optional[str],
+                       limit: Optional[int]) -> sqlite3.Cursor:
+        """Cursor over filtered draft rows, newest first"""
+        filters = {"channel_id": channel_id, "status": status, "opportunity_id": opportunity_id}
+        columns = tuple(column for column, value in filters.items() if value)
+        params = [filters[column] for column in columns]
         if limit:
-            query += " LIMIT ?"
             params.append(limit)
         
-        cursor = self.conn.execute(query, params)
-        return [ContentDraft.from_dict(dict(row)) for row in cursor.fetchall()]
+        query = _filtered_select(_SELECT_DRAFTS, columns, "created_at", bool(limit))
+        return self.conn.execute(query, params)
     
     def update_draft(self, draft: ContentDraft):
-        """Update draft"""
+        """Update draft, appending any edits not yet stored"""
         data = draft.to_dict()
-        self.conn.execute("""
-            UPDATE drafts 
-            SET status=?, human_feedback=?, edits_made=?, reviewed_at=?,
-                posted_at=?, post_url=?, post_id=?
-            WHERE id=?
-        """, (
-            data['status'], data['human_feedback'], data['edits_made'],
-            data['reviewed_at'], data['posted_at'], data['post_url'],
-            data['post_id'], data['id']
+        with self.conn:
+            self.conn.execute(_UPDATE_DRAFT, (
+                data['body'], data['status'], data['human_feedback'],
+                data['reviewed_at'], data['posted_at'], data['post_url'],
+                data['post_id'], data['id']
+            ))
+            # Histories are append-only, so the stored edits are a prefix
+            stored = self._scalar(_COUNT_DRAFT_EDITS, (draft.id,))
+            self.conn.executemany(_INSERT_DRAFT_EDIT, [
+                self._draft_edit_row(draft.id, e) for e in draft.edits_made[stored:]
+            ])
+    
+    def update_draft_status(self, draft_id: str, status: str,
+                            human_feedback: Optional[str] = None,
+                            reviewed_at: Optional[datetime] = None) -> bool:
+        """Record a review decision on a draft. Returns False if not found."""
+        reviewed_at = reviewed_at or datetime.utcnow()
+        cursor = self.conn.execute(_UPDATE_DRAFT_STATUS, (
+            status, human_feedback, reviewed_at.isoformat(), draft_id
         ))
         self.conn.commit()
+        return cursor.rowcount > 0
+    
+    def update_draft_body(self, draft_id: str, body: str,
+                          edit: Optional[EditRecord] = None):
+        """Replace a draft's body, recording the edit in the same transaction"""
+        with self.conn:
+            self.conn.execute(_UPDATE_DRAFT_BODY, (body, draft_id))
+            if edit is not None:
+                self._insert_draft_edit(draft_id, edit)
+    
+    def add_draft_edit(self, draft_id: str, edit: EditRecord):
+        """Append an edit to a draft's history"""
+        with self.conn:
+            self._insert_draft_edit(draft_id, edit)
+    
+    def _insert_draft_edit(self, draft_id: str, edit: EditRecord):
+        self.conn.execute(_INSERT_DRAFT_EDIT, self._draft_edit_row(draft_id, edit))
+    
+    @staticmethod
+    def _draft_edit_row(draft_id: str, edit: EditRecord) -> tuple:
+        """Edit as a draft_edits INSERT parameter tuple"""
+        return (
+            draft_id, edit.timestamp.isoformat(), edit.editor, edit.change_type,
+            edit.before, edit.after, edit.reason
+        )
+    
+    def mark_draft_posted(self, draft_id: str, post_url: str, post_id: str,
+                          posted_at: Optional[datetime] = None) -> bool:
+        """Mark a draft as posted. Returns False if not found."""
+        posted_at = posted_at or datetime.utcnow()
+        cursor = self.conn.execute(_MARK_DRAFT_POSTED, (
+            posted_at.isoformat(), post_url, post_id, draft_id
+        ))
+        self.conn.commit()
+        return cursor.rowcount > 0
+    
+    # Statistics
+    def get_stats_counts(self) -> Dict[str, int]:
+        """Count channels, opportunities and drafts in a single query"""
+        cursor = self._raw_cursor().execute("""
+            SELECT
+                (SELECT COUNT(*) FROM channels) AS channels,
+                (SELECT COUNT(*) FROM opportunities) AS opportunities,
+                (SELECT COUNT(*) FROM opportunities WHERE status = 'new') AS opportunities_new,
+                COUNT(*) AS drafts,
+                COALESCE(SUM(CASE WHEN status = 'pending_review' THEN 1 ELSE 0 END), 0)
+                    AS drafts_pending_review,
+                COALESCE(SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END), 0)
+                    AS drafts_approved
+            FROM drafts
+        """)
+        return dict(zip((col[0] for col in cursor.description), cursor.fetchone()))
     
     def close(self):
-        """Close database connection"""
-        self.conn.close()
+        """Close every thread's database connection"""
+        with self._connections_lock:
+            holders = list(self._connections)
+            self._connections.clear()
+        for holder in holders:
+            holder.conn.close()
+        self._local = threading.local()
     
     def __enter__(self):
         return self
@@ -0,0 +1,18 @@
+"""Gunicorn configuration for the Empirica Outreach API
+
+Usage:
+    gunicorn -c gunicorn_conf.py 'empirica_outreach.api:create_app()'
+"""
+
+import os
+
+bind = "0.0.0.0:8001"
+
+# Background Scout jobs are tracked in process memory, so status polls
+# must reach the worker that started the job: scale with threads, not
+# worker processes.
+workers = 1
+worker_class = "gthread"
+threads = (os.cpu_count() or 2) * 2 + 1
+
+timeout = 60
@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
-"""Start Empirica Outreach API server"""
+"""Start Empirica Outreach API server
 
+This runs Flask's built-in server. For anything beyond local use, run
+under gunicorn instead:
+
+    gunicorn -c gunicorn_conf.py 'empirica_outreach.api:create_app()'
+
+Set EMPIRICA_DEBUG=1 for the debugger and auto-reloader.
+"""
+
+import os
 import sys
 sys.path.insert(0, '.')
 sys.path.insert(0, '../empirica')
@@ -9,8 +18,9 @@ from empirica_outreach.api import create_app
 
 if __name__ == '__main__':
     app = create_app()
+    debug = os.getenv("EMPIRICA_DEBUG", "").lower() in ("1", "true", "yes")
     print("🚀 Empirica Outreach API")
     print("   Dashboard: http://localhost:8001/api/v1/outreach/")
     print("   Health: http://localhost:8001/health")
     print("")
-    app.run(host="0.0.0.0", port=8001, debug=True)
+    app.run(host="0.0.0.0", port=8001, threaded=True, debug=debug)
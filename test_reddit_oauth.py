@@ -21,10 +21,11 @@ def test_oauth_setup():
     print()
     
     # Check credentials
-    client_id = os.getenv("REDDIT_CLIENT_ID")
-    client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-    username = os.getenv("REDDIT_USERNAME")
-    password = os.getenv("REDDIT_PASSWORD")
+    env = os.environ
+    client_id = env.get("REDDIT_CLIENT_ID")
+    client_secret = env.get("REDDIT_CLIENT_SECRET")
+    username = env.get("REDDIT_USERNAME")
+    password = env.get("REDDIT_PASSWORD")
     
     if not client_id or not client_secret:
         print("❌ Missing credentials in .env file")
@@ -62,8 +63,6 @@ def test_oauth_setup():
     # Test API call
     try:
         print("Testing API call: Fetching r/ArtificialIntelligence hot posts...")
-        print("(Note: This will have 1-2 second delay due to rate limiting)")
-        print()
         
         posts = client.get_hot_posts("ArtificialIntelligence", limit=5)
         
@@ -88,7 +87,7 @@ def test_oauth_setup():
         print()
         print("✅ You can now use submit_comment() to post")
         print("✅ Rate limited to 55 requests/minute")
-        print("✅ Human-like 1-2s delays between actions")
+        print("✅ Human-like 1-2s delays before each post")
         print()
     else:
         print("=" * 60)
@@ -103,9 +102,9 @@ def test_oauth_setup():
     print("=" * 60)
     print()
     print("✅ Conservative: 55 req/min (leaving 5 buffer)")
-    print("✅ Human-like: 1-2s random delays")
+    print("✅ Human-like: 1-2s random delays when posting")
     print("✅ Thread-safe: Multiple operations won't conflict")
-    print("✅ Smooth: No bursting, no rate limit hits")
+    print("✅ Smooth: Only waits when the 60s window is full")
     print()
     
     return True